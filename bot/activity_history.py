@@ -0,0 +1,137 @@
+from array import array
+
+HOUR_SLOTS = 48
+DAY_SLOTS = 30
+HOUR_BUCKET_MAX = 0xFFFF
+PERIOD_WINDOWS = (1, 7, 30)  # leaderboard periods in days, today included
+
+class ActivityHistory:
+    """Rolling activity points for one member.
+
+    Points land in an hourly ring covering the last 48 hours. When an hour
+    falls out of that ring it is compacted into a daily ring covering the
+    last 30 days, so each point lives in exactly one bucket and a period
+    total is a sum over at most 48 + 30 buckets.
+    """
+
+    __slots__ = ('hour_head', 'hours', 'day_head', 'days')
+
+    def __init__(self):
+        self.hour_head = 0  # newest hour index (unix hours) in the hourly ring
+        self.hours = array('H', bytes(2 * HOUR_SLOTS))
+        self.day_head = 0   # newest day index (unix days) in the daily ring
+        self.days = array('I', bytes(4 * DAY_SLOTS))
+
+    def add(self, hour, points):
+        """Credit points to the given unix hour"""
+        if hour > self.hour_head:
+            self._advance_hours(hour)
+        elif hour <= self.hour_head - HOUR_SLOTS:
+            self._add_day(hour // 24, points)
+            return
+
+        slot = hour % HOUR_SLOTS
+        self.hours[slot] = min(HOUR_BUCKET_MAX, self.hours[slot] + points)
+
+    def _advance_hours(self, hour):
+        # Every hour that leaves the ring is folded into its day bucket
+        for expired in range(self.hour_head - HOUR_SLOTS + 1, min(hour - HOUR_SLOTS, self.hour_head) + 1):
+            slot = expired % HOUR_SLOTS
+            if self.hours[slot]:
+                self._add_day(expired // 24, self.hours[slot])
+                self.hours[slot] = 0
+        self.hour_head = hour
+
+    def _add_day(self, day, points):
+        if day > self.day_head:
+            for expired in range(max(self.day_head + 1, day - DAY_SLOTS + 1), day + 1):
+                self.days[expired % DAY_SLOTS] = 0
+            self.day_head = day
+        elif day <= self.day_head - DAY_SLOTS:
+            return
+        self.days[day % DAY_SLOTS] += points
+
+    def total_since(self, start_hour):
+        """Points earned from the given unix hour onwards, start_hour on a day boundary"""
+        total = 0
+        for hour in range(max(start_hour, self.hour_head - HOUR_SLOTS + 1), self.hour_head + 1):
+            total += self.hours[hour % HOUR_SLOTS]
+        for day in range(max(start_hour // 24, self.day_head - DAY_SLOTS + 1), self.day_head + 1):
+            total += self.days[day % DAY_SLOTS]
+        return total
+
+    def daily_totals(self):
+        """Return ``{unix day: points}`` for every day with points in either ring"""
+        totals = {}
+        for day in range(self.day_head - DAY_SLOTS + 1, self.day_head + 1):
+            if self.days[day % DAY_SLOTS]:
+                totals[day] = self.days[day % DAY_SLOTS]
+        for hour in range(self.hour_head - HOUR_SLOTS + 1, self.hour_head + 1):
+            if self.hours[hour % HOUR_SLOTS]:
+                totals[hour // 24] = totals.get(hour // 24, 0) + self.hours[hour % HOUR_SLOTS]
+        return totals
+
+    def dump(self):
+        """Return a compact tuple for persistence"""
+        return (self.hour_head, self.hours.tobytes(), self.day_head, self.days.tobytes())
+
+    @classmethod
+    def restore(cls, dumped):
+        history = cls()
+        history.hour_head, hours, history.day_head, days = dumped
+        history.hours = array('H', hours)
+        history.days = array('I', days)
+        return history
+
+class PeriodTotals:
+    """Running activity points per member for one guild's leaderboard periods.
+
+    Each window covers the last ``n`` UTC days including today. Points are
+    added to every window as they are credited, and when the day changes
+    the points of each day that leaves a window are subtracted from it. A
+    period leaderboard then only looks at members active in that window
+    instead of summing every member's history.
+    """
+
+    def __init__(self, windows=PERIOD_WINDOWS):
+        self.windows = windows
+        self.span = max(windows)
+        self.today = 0
+        self.days = {}  # unix day -> {user_id: points}, only days inside the largest window
+        self.totals = {window: {} for window in windows}  # window -> {user_id: points}
+
+    def add(self, day, user_id, points):
+        """Credit points earned on the given unix day"""
+        if day > self.today:
+            self.advance(day)
+        elif day <= self.today - self.span:
+            return
+
+        counts = self.days.setdefault(day, {})
+        counts[user_id] = counts.get(user_id, 0) + points
+        for window, totals in self.totals.items():
+            if day > self.today - window:
+                totals[user_id] = totals.get(user_id, 0) + points
+
+    def advance(self, today):
+        """Move the windows forward to ``today``, dropping days that left them"""
+        if today <= self.today:
+            return
+        for day, counts in list(self.days.items()):
+            for window, totals in self.totals.items():
+                # In this window before the move, outside it after
+                if today - window >= day > self.today - window:
+                    for user_id, points in counts.items():
+                        remaining = totals[user_id] - points
+                        if remaining:
+                            totals[user_id] = remaining
+                        else:
+                            del totals[user_id]
+            if day <= today - self.span:
+                del self.days[day]
+        self.today = today
+
+    def totals_for(self, window, today):
+        """Return ``{user_id: points}`` for the last ``window`` days up to today"""
+        self.advance(today)
+        return self.totals[window]
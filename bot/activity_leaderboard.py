@@ -1,75 +1,417 @@
-
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 from bot.config import Config
-from datetime import datetime, timedelta
-from collections import defaultdict
+from bot.activity_store import create_activity_store
+from bot.ranking import TopK
+from bot.activity_history import ActivityHistory, PeriodTotals
+from datetime import datetime, timezone
 import asyncio
+import heapq
+import operator
+import time
+
+# Achievement definitions, the position of each key is its bit in ActivityRecord.achievements.
+# Counter achievements unlock when the counter reaches the threshold, time achievements
+# when the member sends a message during one of the listed UTC hours.
+ACHIEVEMENTS = {
+    'chatter': {'counter': 'messages', 'threshold': 50, 'emoji': '💬', 'name': 'Chatter'},
+    'social_butterfly': {'counter': 'reactions_given', 'threshold': 25, 'emoji': '🦋', 'name': 'Social Butterfly'},
+    'voice_master': {'counter': 'voice_time', 'threshold': 3600, 'emoji': '🎤', 'name': 'Voice Master'},  # 1 hour
+    'commander': {'counter': 'commands_used', 'threshold': 10, 'emoji': '⚡', 'name': 'Commander'},
+    'popular': {'counter': 'reactions_received', 'threshold': 20, 'emoji': '⭐', 'name': 'Popular'},
+    'night_owl': {'hours': {22, 23, 0, 1, 2, 3, 4, 5, 6}, 'emoji': '🦉', 'name': 'Night Owl'},  # 10 PM - 6 AM
+    'early_bird': {'hours': {7, 8, 9}, 'emoji': '🐦', 'name': 'Early Bird'}  # until 9 AM, after night owl hours
+}
+ACHIEVEMENT_BITS = {key: 1 << index for index, key in enumerate(ACHIEVEMENTS)}
+
+class AchievementRules:
+    """Precomputed unlock rules.
+
+    Counters only grow, so an achievement can only unlock on the increment
+    that crosses its threshold. Checking an increment compares it with the
+    counter's thresholds, and the rules themselves only run on a crossing.
+    Time achievements are resolved once per UTC hour, not per message.
+    """
+
+    def __init__(self, achievements):
+        self.thresholds = {}  # counter -> [(threshold, key)] ascending
+        for key, achievement in achievements.items():
+            if 'counter' in achievement:
+                self.thresholds.setdefault(achievement['counter'], []).append((achievement['threshold'], key))
+        for rules in self.thresholds.values():
+            rules.sort()
+        
+        self.hour_keys = [(key, achievement['hours']) for key, achievement in achievements.items() if 'hours' in achievement]
+        self.cached_hour = None
+        self.cached_hour_key = None
+    
+    def reached(self, record):
+        """Bitmask of every counter achievement the record's values already satisfy"""
+        mask = 0
+        for counter, rules in self.thresholds.items():
+            value = getattr(record, counter)
+            for threshold, key in rules:
+                if value >= threshold:
+                    mask |= ACHIEVEMENT_BITS[key]
+        return mask
+    
+    def hour_key(self, now):
+        """Time achievement for the current UTC hour, None if there is none"""
+        hour = now // 3600
+        if hour != self.cached_hour:
+            self.cached_hour = hour
+            self.cached_hour_key = None
+            for key, hours in self.hour_keys:
+                if hour % 24 in hours:
+                    self.cached_hour_key = key
+                    break
+        return self.cached_hour_key
+
+class ActivityRecord:
+    """Activity counters for one user.
+
+    Slotted with integer fields and an achievement bitmask, a fraction of
+    the size of a per-user dict with datetimes and a set.
+    """
+
+    __slots__ = (
+        'messages', 'voice_time', 'reactions_given', 'reactions_received',
+        'commands_used', 'last_active', 'streak_days', 'achievements', 'history'
+    )
+
+    def __init__(self):
+        self.messages = 0
+        self.voice_time = 0  # seconds
+        self.reactions_given = 0
+        self.reactions_received = 0
+        self.commands_used = 0
+        self.last_active = 0  # unix seconds of the last own activity, 0 if none yet
+        self.streak_days = 0  # consecutive UTC days with activity, ending on last_active's day
+        self.achievements = 0  # bitmask of ACHIEVEMENT_BITS
+        self.history = None  # ActivityHistory, created on the first points
+
+    def has_achievement(self, key):
+        return bool(self.achievements & ACHIEVEMENT_BITS[key])
+
+    def achievement_keys(self):
+        return [key for key, bit in ACHIEVEMENT_BITS.items() if self.achievements & bit]
+
+    def achievement_count(self):
+        return self.achievements.bit_count()
+    
+    def current_streak(self, today):
+        """Streak length, 0 once a full UTC day has passed without activity"""
+        return self.streak_days if self.last_active // 86400 >= today - 1 else 0
+
+class GuildActivity:
+    """Activity records, rankings and unsaved changes for one guild"""
+
+    def __init__(self, guild_id, categories):
+        self.guild_id = guild_id
+        self.records = {}  # user_id -> ActivityRecord
+        self.dirty = set()
+        self.rankings = {category: TopK(Config.LEADERBOARD_TRACKED_USERS) for category in categories}
+        self.period_totals = PeriodTotals()
 
 class ActivityLeaderboardCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         
-        # Session-based storage (resets when bot restarts)
-        self.activity_data = defaultdict(lambda: {
-            'messages': 0,
-            'voice_time': 0,
-            'reactions_given': 0,
-            'reactions_received': 0,
-            'commands_used': 0,
-            'last_active': datetime.utcnow(),
-            'join_time': None,
-            'voice_join_time': None,
-            'streak_days': 0
-        })
-        
-        # Session achievements
-        self.achievements = {
-            'chatter': {'threshold': 50, 'emoji': '💬', 'name': 'Chatter'},
-            'social_butterfly': {'threshold': 25, 'emoji': '🦋', 'name': 'Social Butterfly'},
-            'voice_master': {'threshold': 3600, 'emoji': '🎤', 'name': 'Voice Master'},  # 1 hour
-            'commander': {'threshold': 10, 'emoji': '⚡', 'name': 'Commander'},
-            'popular': {'threshold': 20, 'emoji': '⭐', 'name': 'Popular'},
-            'night_owl': {'threshold': 1, 'emoji': '🦉', 'name': 'Night Owl'},
-            'early_bird': {'threshold': 1, 'emoji': '🐦', 'name': 'Early Bird'}
+        # Hot counters live in memory, partitioned per guild so memory, persistence
+        # and ranking scale with each guild. Changed users are written to the store
+        # in batches. Records are only created on writes, reads use records.get()
+        self.store = create_activity_store()
+        self.partitions = {}  # guild_id -> GuildActivity
+        self.achievements = ACHIEVEMENTS
+        self.achievement_rules = AchievementRules(ACHIEVEMENTS)
+        
+        # Leaderboard rankings, kept current as counters change instead of sorting per command
+        self.ranking_values = {
+            'overall': self.calculate_activity_score,
+            'messages': operator.attrgetter('messages'),
+            'voice': operator.attrgetter('voice_time'),
+            'reactions': operator.attrgetter('reactions_received'),
+            'commands': operator.attrgetter('commands_used'),
+            'achievements': ActivityRecord.achievement_count
         }
         
+        # Open voice sessions: (guild_id, user_id) -> time.monotonic() of the last credit
+        self.voice_sessions = {}
+        
         # Start background tasks
-        self.update_leaderboard.start()
+        self.flush_activity.start()
     
-    def cog_unload(self):
-        self.update_leaderboard.cancel()
+    def get_partition(self, guild_id):
+        """Return the guild's partition, creating it for a write"""
+        partition = self.partitions.get(guild_id)
+        if partition is None:
+            partition = self.partitions[guild_id] = GuildActivity(guild_id, self.ranking_values)
+        return partition
     
-    @tasks.loop(minutes=5)
-    async def update_leaderboard(self):
-        """Update voice channel times"""
-        for guild in self.bot.guilds:
-            for member in guild.members:
-                if member.voice and member.voice.channel:
-                    user_id = member.id
-                    if self.activity_data[user_id]['voice_join_time']:
-                        # Add time since last update
-                        time_diff = (datetime.utcnow() - self.activity_data[user_id]['voice_join_time']).total_seconds()
-                        self.activity_data[user_id]['voice_time'] += time_diff
-                    self.activity_data[user_id]['voice_join_time'] = datetime.utcnow()
-    
-    @update_leaderboard.before_loop
-    async def before_update_leaderboard(self):
-        await self.bot.wait_until_ready()
+    def get_record(self, guild_id, user_id):
+        """Return the member's record, creating it for a write"""
+        records = self.get_partition(guild_id).records
+        record = records.get(user_id)
+        if record is None:
+            record = records[user_id] = ActivityRecord()
+        return record
+    
+    def find_record(self, guild_id, user_id):
+        """Read-only lookup, never creates anything"""
+        partition = self.partitions.get(guild_id)
+        return partition.records.get(user_id) if partition else None
+    
+    def mark_changed(self, guild_id, user_id, record):
+        """Queue the record for the next flush and update its rankings"""
+        partition = self.partitions[guild_id]
+        partition.dirty.add(user_id)
+        for category, value_of in self.ranking_values.items():
+            ranking = partition.rankings[category]
+            ranking.update(user_id, value_of(record))
+            if ranking.stale:
+                ranking.rebuild((other_id, value_of(other)) for other_id, other in partition.records.items())
+    
+    def increment(self, guild_id, user_id, record, counter, amount=1):
+        """Add to a counter and unlock any achievement whose threshold it crosses"""
+        old = getattr(record, counter)
+        new = old + amount
+        setattr(record, counter, new)
+        for threshold, key in self.achievement_rules.thresholds.get(counter, ()):
+            if old < threshold <= new:
+                self.unlock(guild_id, user_id, record, key)
+    
+    def unlock(self, guild_id, user_id, record, key):
+        """Award an achievement and announce it, callers mark the record changed.
+        
+        Other cogs can subscribe with an ``on_achievement_unlocked(guild_id, user_id, key)`` listener.
+        """
+        bit = ACHIEVEMENT_BITS[key]
+        if record.achievements & bit:
+            return
+        record.achievements |= bit
+        self.bot.dispatch('achievement_unlocked', guild_id, user_id, key)
+    
+    def add_activity(self, guild_id, user_id, record, points, own_activity=True, now=None):
+        """Credit points to the current hour bucket and, for the member's own
+        activity, extend their daily streak. ``now`` is unix seconds, read
+        from the clock when not given.
+        """
+        if now is None:
+            now = int(time.time())
+        if own_activity:
+            today = now // 86400
+            last_day = record.last_active // 86400
+            if last_day != today or not record.streak_days:
+                record.streak_days = record.streak_days + 1 if last_day == today - 1 else 1
+            record.last_active = now
+        
+        if points:
+            if record.history is None:
+                record.history = ActivityHistory()
+            record.history.add(now // 3600, points)
+            self.partitions[guild_id].period_totals.add(now // 86400, user_id, points)
+        
+        self.mark_changed(guild_id, user_id, record)
+    
+    def restore_partition(self, guild_id, records):
+        """Build a guild's partition from stored records"""
+        partition = self.partitions[guild_id] = GuildActivity(guild_id, self.ranking_values)
+        partition.period_totals.advance(int(time.time()) // 86400)
+        for user_id, stored in records.items():
+            record = ActivityRecord()
+            record.messages = stored['messages']
+            record.voice_time = int(stored['voice_time'])
+            record.reactions_given = stored['reactions_given']
+            record.reactions_received = stored['reactions_received']
+            record.commands_used = stored['commands_used']
+            if stored['last_active']:
+                last_active = datetime.fromisoformat(stored['last_active'])
+                if last_active.tzinfo is None:
+                    last_active = last_active.replace(tzinfo=timezone.utc)
+                record.last_active = int(last_active.timestamp())
+            record.streak_days = stored['streak_days']
+            for key in stored['achievements']:
+                record.achievements |= ACHIEVEMENT_BITS.get(key, 0)
+            if stored.get('history'):
+                record.history = ActivityHistory.restore(stored['history'])
+            # Thresholds crossed before a rule existed are awarded quietly
+            record.achievements |= self.achievement_rules.reached(record)
+            partition.records[user_id] = record
+            for category, value_of in self.ranking_values.items():
+                partition.rankings[category].update(user_id, value_of(record))
+            if record.history:
+                for day, points in record.history.daily_totals().items():
+                    partition.period_totals.add(day, user_id, points)
+    
+    async def cog_load(self):
+        """Restore persisted activity before any events are handled"""
+        try:
+            stored = await self.store.load()
+        except Exception as e:
+            print(f"❌ Failed to load activity data: {e}")
+            return
+        
+        for guild_id, records in stored.items():
+            self.restore_partition(guild_id, records)
+        
+        print(f"✅ Loaded activity data for {sum(len(records) for records in stored.values())} members in {len(stored)} guilds")
+        
+        # Reloaded after startup, on_ready will not fire again
+        if self.bot.is_ready():
+            await self.on_ready()
+    
+    async def cog_unload(self):
+        self.flush_activity.cancel()
+        await self.close_store()
+    
+    async def close_store(self):
+        """Flush pending counters and close the store, safe to call twice"""
+        if self.store is None:
+            return
+        self.checkpoint_voice_sessions()
+        await self.flush_to_store()
+        await self.store.close()
+        self.store = None
+    
+    def serialize_user(self, record):
+        return {
+            'messages': record.messages,
+            'voice_time': record.voice_time,
+            'reactions_given': record.reactions_given,
+            'reactions_received': record.reactions_received,
+            'commands_used': record.commands_used,
+            'last_active': datetime.fromtimestamp(record.last_active, timezone.utc).isoformat(),
+            'streak_days': record.streak_days,
+            'achievements': record.achievement_keys(),
+            'history': record.history.dump() if record.history else None
+        }
+    
+    async def flush_to_store(self, guild_ids=None):
+        """Write every member changed since the last flush in one batch"""
+        if self.store is None:
+            return
+        
+        pending = {}
+        for guild_id in (guild_ids if guild_ids is not None else list(self.partitions)):
+            partition = self.partitions.get(guild_id)
+            if partition and partition.dirty:
+                pending[guild_id] = partition.dirty
+                partition.dirty = set()
+        if not pending:
+            return
+        
+        batch = {
+            guild_id: {user_id: self.serialize_user(self.partitions[guild_id].records[user_id]) for user_id in user_ids}
+            for guild_id, user_ids in pending.items()
+        }
+        
+        try:
+            await self.store.save(batch)
+        except Exception as e:
+            # Keep the members dirty so the next flush retries them
+            for guild_id, user_ids in pending.items():
+                if guild_id in self.partitions:
+                    self.partitions[guild_id].dirty |= user_ids
+            print(f"❌ Failed to persist activity data: {e}")
+    
+    @tasks.loop(seconds=Config.ACTIVITY_FLUSH_INTERVAL)
+    async def flush_activity(self):
+        self.checkpoint_voice_sessions()
+        await self.flush_to_store()
+    
+    async def evict_guild(self, guild_id):
+        """Flush a guild's partition and drop it from memory, its data stays in the store"""
+        for key in [key for key in self.voice_sessions if key[0] == guild_id]:
+            self.credit_voice(key, time.monotonic())
+            del self.voice_sessions[key]
+        await self.flush_to_store([guild_id])
+        self.partitions.pop(guild_id, None)
     
     @commands.Cog.listener()
-    async def on_message(self, message):
-        """Track message activity"""
-        if message.author.bot or not message.guild:
+    async def on_guild_join(self, guild):
+        """Bring back a guild's archived activity when the bot is re-added"""
+        if guild.id in self.partitions or self.store is None:
             return
+        try:
+            stored = await self.store.load(guild.id)
+        except Exception as e:
+            print(f"❌ Failed to load activity data for guild {guild.id}: {e}")
+            return
+        if guild.id in stored and guild.id not in self.partitions:
+            self.restore_partition(guild.id, stored[guild.id])
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        await self.evict_guild(guild.id)
+    
+    def credit_voice(self, key, now):
+        """Add the time since the session's last credit to the member's voice time"""
+        started = self.voice_sessions.get(key)
+        if started is None:
+            return
+        
+        seconds = int(now - started)
+        if seconds > 0:
+            # Carry the fractional second into the next credit
+            self.voice_sessions[key] = started + seconds
+            guild_id, user_id = key
+            record = self.get_record(guild_id, user_id)
+            per_minute = Config.ACTIVITY_POINTS["voice_minute"]
+            # Points come from the growth of the cumulative total, so partial
+            # minutes between checkpoints still add up instead of truncating
+            earned_before = record.voice_time * per_minute // 60
+            self.increment(guild_id, user_id, record, 'voice_time', seconds)
+            self.add_activity(guild_id, user_id, record, record.voice_time * per_minute // 60 - earned_before)
+    
+    def checkpoint_voice_sessions(self):
+        """Credit open sessions so long calls show up before the member leaves"""
+        now = time.monotonic()
+        for key in list(self.voice_sessions):
+            self.credit_voice(key, now)
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Partitions of guilds the bot has left are only kept in the store
+        current_guilds = {guild.id for guild in self.bot.guilds}
+        for guild_id in [guild_id for guild_id in self.partitions if guild_id not in current_guilds]:
+            await self.evict_guild(guild_id)
         
+        self.rebuild_voice_sessions()
+    
+    def rebuild_voice_sessions(self):
+        """Rebuild open voice sessions from the members currently in voice"""
+        now = time.monotonic()
+        in_voice = set()
+        for guild in self.bot.guilds:
+            for channel in [*guild.voice_channels, *guild.stage_channels]:
+                for member in channel.members:
+                    if not member.bot:
+                        in_voice.add((guild.id, member.id))
+        
+        # Sessions that ended while disconnected are credited up to now
+        for key in list(self.voice_sessions):
+            if key not in in_voice:
+                self.credit_voice(key, now)
+                del self.voice_sessions[key]
+        
+        for key in in_voice:
+            self.voice_sessions.setdefault(key, now)
+    
+    @commands.Cog.listener()
+    async def on_message_features(self, message, features):
+        """Track message activity"""
+        guild_id = message.guild.id
         user_id = message.author.id
-        self.activity_data[user_id]['messages'] += 1
-        self.activity_data[user_id]['last_active'] = datetime.utcnow()
+        record = self.get_record(guild_id, user_id)
+        self.increment(guild_id, user_id, record, 'messages')
+        
+        # The message stage already read the clock for this message
+        hour_key = self.achievement_rules.hour_key(features.timestamp)
+        if hour_key:
+            self.unlock(guild_id, user_id, record, hour_key)
         
-        # Check for achievements
-        await self.check_achievements(message.author, message.channel)
+        self.add_activity(guild_id, user_id, record, Config.ACTIVITY_POINTS["message"], now=features.timestamp)
     
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction, user):
@@ -77,12 +419,18 @@ class ActivityLeaderboardCog(commands.Cog):
         if user.bot or not reaction.message.guild:
             return
         
+        guild_id = reaction.message.guild.id
+        
         # User giving reaction
-        self.activity_data[user.id]['reactions_given'] += 1
+        giver = self.get_record(guild_id, user.id)
+        self.increment(guild_id, user.id, giver, 'reactions_given')
+        self.add_activity(guild_id, user.id, giver, Config.ACTIVITY_POINTS["reaction_given"])
         
         # User receiving reaction
         if not reaction.message.author.bot:
-            self.activity_data[reaction.message.author.id]['reactions_received'] += 1
+            receiver = self.get_record(guild_id, reaction.message.author.id)
+            self.increment(guild_id, reaction.message.author.id, receiver, 'reactions_received')
+            self.add_activity(guild_id, reaction.message.author.id, receiver, Config.ACTIVITY_POINTS["reaction_received"], own_activity=False)
     
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
@@ -90,80 +438,82 @@ class ActivityLeaderboardCog(commands.Cog):
         if member.bot:
             return
         
-        user_id = member.id
+        key = (member.guild.id, member.id)
         
-        # Joined voice channel
+        # Joined voice channel, switching channels keeps the session open
         if after.channel and not before.channel:
-            self.activity_data[user_id]['voice_join_time'] = datetime.utcnow()
+            self.voice_sessions[key] = time.monotonic()
         
         # Left voice channel
         elif before.channel and not after.channel:
-            if self.activity_data[user_id]['voice_join_time']:
-                time_diff = (datetime.utcnow() - self.activity_data[user_id]['voice_join_time']).total_seconds()
-                self.activity_data[user_id]['voice_time'] += time_diff
-                self.activity_data[user_id]['voice_join_time'] = None
+            self.credit_voice(key, time.monotonic())
+            self.voice_sessions.pop(key, None)
     
     @commands.Cog.listener()
     async def on_app_command_completion(self, interaction, command):
         """Track command usage"""
-        if interaction.user.bot:
+        if interaction.user.bot or not interaction.guild:
             return
         
-        user_id = interaction.user.id
-        self.activity_data[user_id]['commands_used'] += 1
-        self.activity_data[user_id]['last_active'] = datetime.utcnow()
-    
-    async def check_achievements(self, user, channel):
-        """Check and award achievements"""
-        user_id = user.id
-        data = self.activity_data[user_id]
-        
-        achievements_earned = []
-        
-        # Check message-based achievements
-        if data['messages'] >= self.achievements['chatter']['threshold']:
-            achievements_earned.append('chatter')
-        
-        if data['reactions_given'] >= self.achievements['social_butterfly']['threshold']:
-            achievements_earned.append('social_butterfly')
-        
-        if data['voice_time'] >= self.achievements['voice_master']['threshold']:
-            achievements_earned.append('voice_master')
-        
-        if data['commands_used'] >= self.achievements['commander']['threshold']:
-            achievements_earned.append('commander')
-        
-        if data['reactions_received'] >= self.achievements['popular']['threshold']:
-            achievements_earned.append('popular')
-        
-        # Time-based achievements
-        current_hour = datetime.utcnow().hour
-        if current_hour >= 22 or current_hour <= 6:  # Night owl (10 PM - 6 AM)
-            achievements_earned.append('night_owl')
-        elif current_hour >= 5 and current_hour <= 9:  # Early bird (5 AM - 9 AM)
-            achievements_earned.append('early_bird')
-        
-        # Award achievements (simplified - just track them)
-        for achievement in achievements_earned:
-            if achievement not in data.get('achievements', set()):
-                if 'achievements' not in data:
-                    data['achievements'] = set()
-                data['achievements'].add(achievement)
+        guild_id = interaction.guild.id
+        record = self.get_record(guild_id, interaction.user.id)
+        self.increment(guild_id, interaction.user.id, record, 'commands_used')
+        self.add_activity(guild_id, interaction.user.id, record, Config.ACTIVITY_POINTS["command_used"])
     
     def calculate_activity_score(self, user_data):
         """Calculate activity score"""
         score = 0
-        score += user_data['messages'] * 2
-        score += user_data['voice_time'] // 60  # 1 point per minute
-        score += user_data['reactions_given'] * 1
-        score += user_data['reactions_received'] * 3
-        score += user_data['commands_used'] * 5
-        score += len(user_data.get('achievements', set())) * 25
+        score += user_data.messages * 2
+        score += user_data.voice_time // 60  # 1 point per minute
+        score += user_data.reactions_given * 1
+        score += user_data.reactions_received * 3
+        score += user_data.commands_used * 5
+        score += user_data.achievement_count() * 25
         
         return score
     
+    def guild_top(self, guild, category, limit=Config.LEADERBOARD_MAX_ENTRIES):
+        """Return ``(member, record, score)`` for the best current members in a category"""
+        partition = self.partitions.get(guild.id)
+        if partition is None:
+            return []
+        
+        entries = []
+        for user_id, score in partition.rankings[category].ranked():
+            member = guild.get_member(user_id)
+            if member:
+                entries.append((member, partition.records[user_id], score))
+                if len(entries) == limit:
+                    break
+        return entries
+    
+    def period_top(self, guild, days, limit=Config.LEADERBOARD_MAX_ENTRIES):
+        """Return ``(member, record, points)`` for the most active current members over the last ``days`` UTC days"""
+        partition = self.partitions.get(guild.id)
+        if partition is None:
+            return []
+        
+        # Only members with points in the window are in its running totals
+        totals = partition.period_totals.totals_for(days, int(time.time()) // 86400)
+        heap = [(-points, user_id) for user_id, points in totals.items()]
+        heapq.heapify(heap)
+        
+        entries = []
+        while heap and len(entries) < limit:
+            negative_points, user_id = heapq.heappop(heap)
+            member = guild.get_member(user_id)
+            if member:
+                entries.append((member, partition.records[user_id], -negative_points))
+        return entries
+    
     @app_commands.command(name="leaderboard", description="View the activity leaderboard")
-    @app_commands.describe(category="Category to view")
+    @app_commands.describe(category="Category to view", period="Time period (periods other than all time rank activity points)")
+    @app_commands.choices(period=[
+        app_commands.Choice(name="🏆 All Time", value="all"),
+        app_commands.Choice(name="☀️ Today (UTC)", value="today"),
+        app_commands.Choice(name="📅 Last 7 Days", value="7d"),
+        app_commands.Choice(name="🗓️ Last 30 Days", value="30d")
+    ])
     @app_commands.choices(category=[
         app_commands.Choice(name="📊 Overall Activity", value="overall"),
         app_commands.Choice(name="💬 Messages", value="messages"),
@@ -172,17 +522,20 @@ class ActivityLeaderboardCog(commands.Cog):
         app_commands.Choice(name="⚡ Commands", value="commands"),
         app_commands.Choice(name="🏆 Achievements", value="achievements")
     ])
-    async def leaderboard(self, interaction: discord.Interaction, category: str = "overall"):
+    async def leaderboard(self, interaction: discord.Interaction, category: str = "overall", period: str = "all"):
         """Display activity leaderboard"""
-        if not self.activity_data:
+        if not self.partitions:
             await interaction.response.send_message("No activity data available yet! Start chatting to build the leaderboard! 🌴", ephemeral=True)
             return
         
-        # Filter to guild members only
-        guild_members = {uid: data for uid, data in self.activity_data.items() 
-                        if interaction.guild.get_member(uid)}
+        if period != "all":
+            await self.send_period_leaderboard(interaction, period)
+            return
+        
+        # Top guild members for the category, read from the maintained ranking
+        top_members = self.guild_top(interaction.guild, category)
         
-        if not guild_members:
+        if not top_members:
             await interaction.response.send_message("No activity data for this server yet! 🏖️", ephemeral=True)
             return
         
@@ -192,108 +545,73 @@ class ActivityLeaderboardCog(commands.Cog):
             timestamp=datetime.utcnow()
         )
         
-        if category == "overall":
-            # Sort by activity score
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: self.calculate_activity_score(x[1]), 
-                                reverse=True)
-            embed.description = "📊 **Overall Activity Rankings**"
-            
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    score = self.calculate_activity_score(data)
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Score:** {score:,}\n**Messages:** {data['messages']}\n**Voice:** {data['voice_time']//60:.0f}m",
-                        inline=True
-                    )
-        
-        elif category == "messages":
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: x[1]['messages'], 
-                                reverse=True)
-            embed.description = "💬 **Message Champions**"
-            
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Messages:** {data['messages']:,}",
-                        inline=True
-                    )
-        
-        elif category == "voice":
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: x[1]['voice_time'], 
-                                reverse=True)
-            embed.description = "🎤 **Voice Masters**"
+        embed.description = {
+            "overall": "📊 **Overall Activity Rankings**",
+            "messages": "💬 **Message Champions**",
+            "voice": "🎤 **Voice Masters**",
+            "reactions": "⭐ **Most Popular**",
+            "commands": "⚡ **Command Masters**",
+            "achievements": "🏆 **Achievement Hunters**"
+        }[category]
+        
+        for i, (member, data, score) in enumerate(top_members, 1):
+            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
             
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    hours = data['voice_time'] // 3600
-                    minutes = (data['voice_time'] % 3600) // 60
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Time:** {hours:.0f}h {minutes:.0f}m",
-                        inline=True
-                    )
-        
-        elif category == "reactions":
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: x[1]['reactions_received'], 
-                                reverse=True)
-            embed.description = "⭐ **Most Popular**"
+            if category == "overall":
+                value = f"**Score:** {score:,}\n**Messages:** {data.messages}\n**Voice:** {data.voice_time//60:.0f}m"
+            elif category == "messages":
+                value = f"**Messages:** {data.messages:,}"
+            elif category == "voice":
+                hours = data.voice_time // 3600
+                minutes = (data.voice_time % 3600) // 60
+                value = f"**Time:** {hours:.0f}h {minutes:.0f}m"
+            elif category == "reactions":
+                value = f"**Received:** {data.reactions_received}\n**Given:** {data.reactions_given}"
+            elif category == "commands":
+                value = f"**Commands:** {data.commands_used:,}"
+            else:
+                achievements = data.achievement_keys()
+                value = f"**Achievements:** {len(achievements)}\n{' '.join([self.achievements[a]['emoji'] for a in achievements][:5])}"
             
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Received:** {data['reactions_received']}\n**Given:** {data['reactions_given']}",
-                        inline=True
-                    )
-        
-        elif category == "commands":
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: x[1]['commands_used'], 
-                                reverse=True)
-            embed.description = "⚡ **Command Masters**"
-            
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Commands:** {data['commands_used']:,}",
-                        inline=True
-                    )
-        
-        elif category == "achievements":
-            sorted_users = sorted(guild_members.items(), 
-                                key=lambda x: len(x[1].get('achievements', set())), 
-                                reverse=True)
-            embed.description = "🏆 **Achievement Hunters**"
-            
-            for i, (user_id, data) in enumerate(sorted_users[:10], 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    achievements = data.get('achievements', set())
-                    medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-                    embed.add_field(
-                        name=f"{medal} {member.display_name}",
-                        value=f"**Achievements:** {len(achievements)}\n{' '.join([self.achievements[a]['emoji'] for a in achievements][:5])}",
-                        inline=True
-                    )
-        
-        embed.set_footer(text="Monroe Social Club - Session Leaderboard (Resets on Bot Restart)")
+            embed.add_field(
+                name=f"{medal} {member.display_name}",
+                value=value,
+                inline=True
+            )
+        
+        embed.set_footer(text="Monroe Social Club - Activity Leaderboard")
+        await interaction.response.send_message(embed=embed)
+    
+    async def send_period_leaderboard(self, interaction, period):
+        """Rank members by activity points earned today or in the last 7/30 days"""
+        today = int(time.time()) // 86400
+        days_back, title = {
+            "today": (0, "☀️ **Most Active Today (UTC)**"),
+            "7d": (6, "📅 **Most Active - Last 7 Days**"),
+            "30d": (29, "🗓️ **Most Active - Last 30 Days**")
+        }[period]
+        
+        top_members = self.period_top(interaction.guild, days_back + 1)
+        if not top_members:
+            await interaction.response.send_message("No activity in this period yet! 🏖️", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"🏆 Monroe Social Club - Activity Leaderboard",
+            description=title,
+            color=Config.COLORS["pink"],
+            timestamp=datetime.utcnow()
+        )
+        
+        for i, (member, data, points) in enumerate(top_members, 1):
+            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
+            embed.add_field(
+                name=f"{medal} {member.display_name}",
+                value=f"**Points:** {points:,}\n**Streak:** {data.current_streak(today)}d",
+                inline=True
+            )
+        
+        embed.set_footer(text="Monroe Social Club - Activity Leaderboard")
         await interaction.response.send_message(embed=embed)
     
     @app_commands.command(name="my_activity", description="View your activity stats")
@@ -301,11 +619,11 @@ class ActivityLeaderboardCog(commands.Cog):
         """Display user's activity stats"""
         user_id = interaction.user.id
         
-        if user_id not in self.activity_data:
+        data = self.find_record(interaction.guild.id, user_id) if interaction.guild else None
+        if data is None:
             await interaction.response.send_message("You haven't been active yet! Start chatting to build your stats! 🌴", ephemeral=True)
             return
         
-        data = self.activity_data[user_id]
         score = self.calculate_activity_score(data)
         
         embed = discord.Embed(
@@ -320,31 +638,48 @@ class ActivityLeaderboardCog(commands.Cog):
             inline=True
         )
         
+        # Members who left the guild are hidden from the leaderboard, so they don't count here either
+        guild = interaction.guild
+        rank = self.partitions[guild.id].rankings['overall'].rank(user_id, lambda other_id: guild.get_member(other_id) is not None)
+        embed.add_field(
+            name="🏅 Rank",
+            value=f"**#{rank}**" if rank else f"Outside the top {Config.LEADERBOARD_TRACKED_USERS}",
+            inline=True
+        )
+        
         embed.add_field(
             name="💬 Messages",
-            value=f"**{data['messages']:,}** sent",
+            value=f"**{data.messages:,}** sent",
             inline=True
         )
         
         embed.add_field(
             name="🎤 Voice Time",
-            value=f"**{data['voice_time']//3600:.0f}h {(data['voice_time']%3600)//60:.0f}m**",
+            value=f"**{data.voice_time//3600:.0f}h {(data.voice_time%3600)//60:.0f}m**",
             inline=True
         )
         
         embed.add_field(
             name="⭐ Reactions",
-            value=f"**Given:** {data['reactions_given']}\n**Received:** {data['reactions_received']}",
+            value=f"**Given:** {data.reactions_given}\n**Received:** {data.reactions_received}",
             inline=True
         )
         
         embed.add_field(
             name="⚡ Commands",
-            value=f"**{data['commands_used']:,}** used",
+            value=f"**{data.commands_used:,}** used",
+            inline=True
+        )
+        
+        today = int(time.time()) // 86400
+        week_points = data.history.total_since((today - 6) * 24) if data.history else 0
+        embed.add_field(
+            name="🔥 Streak",
+            value=f"**{data.current_streak(today)}** days\n**Last 7 days:** {week_points:,} pts",
             inline=True
         )
         
-        achievements = data.get('achievements', set())
+        achievements = data.achievement_keys()
         if achievements:
             achievement_text = "\n".join([
                 f"{self.achievements[a]['emoji']} {self.achievements[a]['name']}"
@@ -357,7 +692,7 @@ class ActivityLeaderboardCog(commands.Cog):
             )
         
         embed.set_thumbnail(url=interaction.user.avatar.url if interaction.user.avatar else None)
-        embed.set_footer(text="Monroe Social Club - Your Session Stats")
+        embed.set_footer(text="Monroe Social Club - Your Activity Stats")
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
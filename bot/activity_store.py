@@ -0,0 +1,180 @@
+import os
+import sqlite3
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from bot.config import Config
+
+class ActivityStore(ABC):
+    """Persistence interface for the activity leaderboard.
+
+    Data is partitioned by guild. ``load(guild_id=None)`` returns
+    ``{guild_id: {user_id: record}}`` for every guild, or just the one asked
+    for, and ``save(partitions)`` upserts records given in the same shape.
+    Records are plain dicts with the counter fields of an ``ActivityRecord``;
+    ``last_active`` is an ISO string, ``achievements`` a list of achievement
+    keys and ``history`` either None or the tuple from
+    ``ActivityHistory.dump()``.
+    """
+
+    @abstractmethod
+    async def load(self, guild_id=None):
+        ...
+
+    @abstractmethod
+    async def save(self, partitions):
+        ...
+
+    async def close(self):
+        pass
+
+class MemoryActivityStore(ActivityStore):
+    """In-process stand-in for local runs and tests, nothing touches disk"""
+
+    def __init__(self):
+        self.partitions = {}
+
+    async def load(self, guild_id=None):
+        return {
+            stored_guild_id: {user_id: dict(record) for user_id, record in records.items()}
+            for stored_guild_id, records in self.partitions.items()
+            if guild_id is None or stored_guild_id == guild_id
+        }
+
+    async def save(self, partitions):
+        for guild_id, records in partitions.items():
+            stored = self.partitions.setdefault(guild_id, {})
+            for user_id, record in records.items():
+                stored[user_id] = dict(record)
+
+class SQLiteActivityStore(ActivityStore):
+    """SQLite backend in WAL mode.
+
+    All database work runs on one dedicated thread so the event loop never
+    blocks on disk, and each save is a single transaction.
+    """
+
+    COLUMNS = (
+        'messages', 'voice_time', 'reactions_given', 'reactions_received',
+        'commands_used', 'last_active', 'streak_days', 'achievements'
+    )
+
+    def __init__(self, path):
+        self.path = path
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="activity-db")
+        self.connection = None
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _connect(self):
+        if self.connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            # Keyed guild first so one guild's rows can be loaded or archived on their own
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS guild_activity (
+                    guild_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    messages INTEGER NOT NULL DEFAULT 0,
+                    voice_time REAL NOT NULL DEFAULT 0,
+                    reactions_given INTEGER NOT NULL DEFAULT 0,
+                    reactions_received INTEGER NOT NULL DEFAULT 0,
+                    commands_used INTEGER NOT NULL DEFAULT 0,
+                    last_active TEXT,
+                    streak_days INTEGER NOT NULL DEFAULT 0,
+                    achievements TEXT NOT NULL DEFAULT '',
+                    PRIMARY KEY (guild_id, user_id)
+                ) WITHOUT ROWID
+            """)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS activity_history (
+                    guild_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    hour_head INTEGER NOT NULL,
+                    hours BLOB NOT NULL,
+                    day_head INTEGER NOT NULL,
+                    days BLOB NOT NULL,
+                    PRIMARY KEY (guild_id, user_id)
+                ) WITHOUT ROWID
+            """)
+            self.connection.commit()
+        return self.connection
+
+    def _load_sync(self, guild_id):
+        connection = self._connect()
+        columns = ', '.join(f"a.{column}" for column in self.COLUMNS)
+        query = f"""
+            SELECT a.guild_id, a.user_id, {columns}, h.hour_head, h.hours, h.day_head, h.days
+            FROM guild_activity a
+            LEFT JOIN activity_history h ON h.guild_id = a.guild_id AND h.user_id = a.user_id
+        """
+        if guild_id is None:
+            rows = connection.execute(query).fetchall()
+        else:
+            rows = connection.execute(f"{query} WHERE a.guild_id = ?", (guild_id,)).fetchall()
+
+        partitions = {}
+        for row in rows:
+            row_guild_id, user_id = row[0], row[1]
+            record = dict(zip(self.COLUMNS, row[2:2 + len(self.COLUMNS)]))
+            record['achievements'] = [a for a in record['achievements'].split(',') if a]
+            history = row[2 + len(self.COLUMNS):]
+            record['history'] = tuple(history) if history[0] is not None else None
+            partitions.setdefault(row_guild_id, {})[user_id] = record
+        return partitions
+
+    def _save_sync(self, partitions):
+        connection = self._connect()
+        rows = [
+            (guild_id, user_id, *(
+                ','.join(record['achievements']) if column == 'achievements' else record[column]
+                for column in self.COLUMNS
+            ))
+            for guild_id, records in partitions.items()
+            for user_id, record in records.items()
+        ]
+        history_rows = [
+            (guild_id, user_id, *record['history'])
+            for guild_id, records in partitions.items()
+            for user_id, record in records.items()
+            if record.get('history') is not None
+        ]
+        placeholders = ', '.join('?' for _ in range(len(self.COLUMNS) + 2))
+        with connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO guild_activity (guild_id, user_id, {', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO activity_history (guild_id, user_id, hour_head, hours, day_head, days) VALUES (?, ?, ?, ?, ?, ?)",
+                history_rows
+            )
+
+    def _close_sync(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    async def load(self, guild_id=None):
+        return await self._run(self._load_sync, guild_id)
+
+    async def save(self, partitions):
+        if partitions:
+            await self._run(self._save_sync, partitions)
+
+    async def close(self):
+        await self._run(self._close_sync)
+        self.executor.shutdown(wait=True)
+
+def create_activity_store():
+    """Build the store selected by Config.ACTIVITY_STORE_BACKEND"""
+    if Config.ACTIVITY_STORE_BACKEND == "memory":
+        return MemoryActivityStore()
+    return SQLiteActivityStore(Config.ACTIVITY_DB_PATH)
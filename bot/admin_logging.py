@@ -7,12 +7,8 @@ class AdminLogging(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
     
-    async def send_admin_log(self, member, action, description, message_link=None, color=None, additional_info=None):
-        """Send a formatted log message to the admin logging channel"""
-        channel = self.bot.get_channel(Config.ADMIN_LOG_CHANNEL)
-        if not channel:
-            return
-        
+    async def send_admin_log(self, member, action, description, message_link=None, color=None, additional_info=None, severity="low"):
+        """Queue a formatted log message for the admin logging channel"""
         embed = discord.Embed(
             title=f"📋 {action}",
             description=description,
@@ -51,10 +47,8 @@ class AdminLogging(commands.Cog):
         
         embed.set_footer(text="Monroe Social Club - Admin Logging", icon_url=self.bot.user.avatar.url)
         
-        try:
-            await channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send admin log: {e}")
+        # Never wait on Discord I/O from a listener
+        self.bot.log_dispatcher.send_nowait(Config.ADMIN_LOG_CHANNEL, embed, severity=severity)
     
     @commands.Cog.listener()
     async def on_member_join(self, member):
@@ -85,7 +79,8 @@ class AdminLogging(commands.Cog):
             member=user,
             action="Member Banned",
             description=f"{user.name} was banned from the server",
-            color=Config.LOG_COLORS["member_ban"]
+            color=Config.LOG_COLORS["member_ban"],
+            severity="high"
         )
     
     @commands.Cog.listener()
@@ -103,7 +98,8 @@ class AdminLogging(commands.Cog):
             description=f"Message deleted in {message.channel.mention}",
             message_link=message_link,
             color=Config.LOG_COLORS["message_delete"],
-            additional_info=f"Content: `{content_preview}`" if content_preview else "Empty content or attachments"
+            additional_info=f"Content: `{content_preview}`" if content_preview else "Empty content or attachments",
+            severity="medium"
         )
     
     @commands.Cog.listener()
@@ -209,7 +205,8 @@ class AdminLogging(commands.Cog):
                 action=action,
                 description=f"{after.mention}'s profile updated",
                 color=color,
-                additional_info="\n".join(changes)
+                additional_info="\n".join(changes),
+                severity="medium" if "Role" in action else "low"
             )
     
     @commands.Cog.listener()
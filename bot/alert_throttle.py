@@ -0,0 +1,85 @@
+from bot.log_dispatcher import SEVERITY_ORDER
+from bot.rate_tracker import monotonic_seconds
+
+SEVERITIES = sorted(SEVERITY_ORDER, key=SEVERITY_ORDER.get)
+
+def escalate_severity(severity, levels):
+    """Raise a severity by the given number of steps, capped at critical"""
+    index = min(SEVERITY_ORDER.get(severity, 1) + levels, len(SEVERITIES) - 1)
+    return SEVERITIES[index]
+
+class _AlertState:
+    __slots__ = ('level', 'last_sent', 'last_event', 'suppressed', 'payload')
+
+    def __init__(self, now):
+        self.level = 0
+        self.last_sent = now
+        self.last_event = now
+        self.suppressed = 0
+        self.payload = None
+
+class AlertThrottle:
+    """Per-key alert state machine, keyed by e.g. ``(user_id, alert_type)``.
+
+    The first event for a key is sent. Later events inside the cooldown are
+    counted instead of sent, and the count is reported with the next alert.
+    When ``escalate_after`` events pile up inside one cooldown the key
+    escalates: an alert goes out immediately one level higher and the
+    cooldown doubles, up to ``max_level``. Keys that stay quiet for a full
+    cooldown are dropped, which resets their level.
+    """
+
+    def __init__(self, cooldown, escalate_after, max_cooldown, max_level=len(SEVERITIES) - 1):
+        self.cooldown = cooldown
+        self.escalate_after = escalate_after
+        self.max_cooldown = max_cooldown
+        self.max_level = max_level
+        self.states = {}
+
+    def cooldown_for(self, level):
+        return min(self.cooldown * 2 ** level, self.max_cooldown)
+
+    def observe(self, key, payload, now=None):
+        """Record an event, returns an alert dict to send or None if it is suppressed.
+
+        The dict has ``level`` (escalation steps), ``suppressed`` (events
+        rolled into this alert) and ``escalated``.
+        """
+        now = monotonic_seconds() if now is None else now
+        state = self.states.get(key)
+        if state is None:
+            self.states[key] = _AlertState(now)
+            return {'level': 0, 'suppressed': 0, 'escalated': False}
+
+        state.last_event = now
+        if now - state.last_sent >= self.cooldown_for(state.level):
+            return self._release(state, now, escalated=False)
+
+        state.suppressed += 1
+        state.payload = payload
+        if state.suppressed >= self.escalate_after and state.level < self.max_level:
+            state.level += 1
+            return self._release(state, now, escalated=True)
+        return None
+
+    def _release(self, state, now, escalated):
+        alert = {'level': state.level, 'suppressed': state.suppressed, 'escalated': escalated}
+        state.suppressed = 0
+        state.payload = None
+        state.last_sent = now
+        return alert
+
+    def drain(self, now=None):
+        """Return ``(key, payload, alert)`` rollups for keys whose cooldown ended
+        with events still suppressed, and forget keys that went quiet
+        """
+        now = monotonic_seconds() if now is None else now
+        rollups = []
+        for key, state in list(self.states.items()):
+            cooldown = self.cooldown_for(state.level)
+            if state.suppressed and now - state.last_sent >= cooldown:
+                payload = state.payload
+                rollups.append((key, payload, self._release(state, now, escalated=False)))
+            elif not state.suppressed and now - state.last_event >= cooldown:
+                del self.states[key]
+        return rollups
@@ -1,8 +1,14 @@
 import discord
 from discord.ext import commands
 import re
+import hashlib
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from bot.config import Config
-from better_profanity import profanity
+from bot.cache import LRUCache
+from bot.message_analysis import analyze_message
+from bot.profanity_matcher import ProfanityMatcher
 from langdetect import detect, DetectorFactory, LangDetectException
 
 # Set seed for consistent language detection
@@ -12,18 +18,14 @@ class AutomodCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-        # Initialize profanity filter
-        profanity.load_censor_words()
-
-        # Smart moderation patterns
+        # Smart moderation patterns, compiled once. Mentions and links come
+        # from the shared link classifier scan instead of their own regexes.
         self.spam_patterns = {
-            'excessive_caps': r'[A-Z]{10,}',
-            'excessive_punctuation': r'[!?]{5,}',
-            'repeated_chars': r'(.)\1{5,}',
-            'mass_mentions': r'<@[!&]?\d+>',
-            'suspicious_links': r'(discord\.gg|bit\.ly|tinyurl|t\.co)\/\w+',
-            'zalgo_text': r'[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]',
-            'excessive_emojis': r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]{10,}'
+            'excessive_caps': re.compile(r'[A-Z]{10,}'),
+            'excessive_punctuation': re.compile(r'[!?]{5,}'),
+            'repeated_chars': re.compile(r'(.)\1{5,}'),
+            'zalgo_text': re.compile(r'[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]'),
+            'excessive_emojis': re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]{10,}')
         }
 
         # Context-aware detection
@@ -75,55 +77,66 @@ class AutomodCog(commands.Cog):
             'raghead', 'wetback', 'beaner', 'cracker', 'honkey', 'fag'
         ]
 
-        # Add custom words to profanity filter
-        profanity.add_censor_words(self.bad_words)
+        # Compile the better-profanity wordlist plus our custom words into a
+        # single matcher (leetspeak variants included) once at cog load
+        self.profanity_matcher = ProfanityMatcher(self.bad_words, whole_words=Config.PROFANITY_WHOLE_WORDS)
+
+        # Profanity verdicts keyed by a hash of the normalized text, so copy-paste
+        # spam, emoji walls and no-op edits are only matched once
+        self.verdict_cache = LRUCache(maxsize=Config.AUTOMOD_VERDICT_CACHE_SIZE)
+
+        # langdetect is slow and CPU-bound, so it runs on a dedicated worker
+        # thread (one worker keeps langdetect's lazy profile loading safe and
+        # memory flat) with its own result cache
+        self.language_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="langdetect")
+        self.language_cache = LRUCache(maxsize=Config.LANGDETECT_CACHE_SIZE)
+
+    def cog_unload(self):
+        self.language_executor.shutdown(wait=False, cancel_futures=True)
+
+    def content_key(self, normalized):
+        """Return a compact cache key for whitespace-normalized content"""
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
 
     def contains_profanity(self, text):
-        """Check if text contains profanity using multiple methods"""
-        text_lower = text.lower()
-
-        # Method 1: Direct word matching
-        for word in self.bad_words:
-            if word in text_lower:
-                return True, word
-
-        # Method 2: Better-profanity library check
-        if profanity.contains_profanity(text):
-            # Find the specific profane word
-            words = text.split()
-            for word in words:
-                if profanity.contains_profanity(word):
-                    return True, word.lower()
-
-        # Method 3: Pattern matching for variations (with numbers, symbols)
-        for word in self.bad_words:
-            # Create pattern that allows character substitution
-            pattern = word
-            pattern = pattern.replace('a', '[a@4]')
-            pattern = pattern.replace('e', '[e3]')
-            pattern = pattern.replace('i', '[i1!]')
-            pattern = pattern.replace('o', '[o0]')
-            pattern = pattern.replace('s', '[s5$]')
-            pattern = pattern.replace('t', '[t7]')
-
-            if re.search(pattern, text_lower):
-                return True, word
-
-        return False, None
-
-    def detect_spam_patterns(self, text):
-        """Detect spam patterns in text"""
+        """Check if text contains profanity in a single pass over the message"""
+        try:
+            detected_word = self.profanity_matcher.search(text)
+            if detected_word:
+                return True, detected_word
+            return False, None
+        except Exception as e:
+            print(f"❌ Error checking profanity: {e}")
+            return False, None
+
+    def get_profanity_verdict(self, features):
+        """Return the cached profanity check for a message's text"""
+        key = self.content_key(features.normalized)
+
+        verdict = self.verdict_cache.get(key)
+        if verdict is None:
+            verdict = self.contains_profanity(features.lowered)
+            self.verdict_cache.set(key, verdict)
+
+        return verdict
+
+    def detect_spam_patterns(self, features):
+        """Detect spam patterns in a message's normalized text and link scan"""
         detected_patterns = []
 
         for pattern_name, pattern in self.spam_patterns.items():
-            if re.search(pattern, text):
+            if pattern.search(features.normalized):
                 detected_patterns.append(pattern_name)
 
+        if features.scan.mentions:
+            detected_patterns.append('mass_mentions')
+        if features.scan.suspicious_links:
+            detected_patterns.append('suspicious_links')
+
         return detected_patterns
 
-    def detect_context_violations(self, text):
-        """Detect context-based violations"""
-        text_lower = text.lower()
+    def detect_context_violations(self, text_lower):
+        """Detect context-based violations in already lowercased text"""
         detected_contexts = []
 
         for context, keywords in self.context_keywords.items():
@@ -133,7 +146,7 @@ class AutomodCog(commands.Cog):
 
         return detected_contexts
 
-    def calculate_message_score(self, message):
+    def calculate_message_score(self, message, features):
         """Calculate a risk score for the message"""
         score = 0
         factors = []
@@ -144,7 +157,7 @@ class AutomodCog(commands.Cog):
             factors.append("very_long_message")
 
         # Mention factors
-        mention_count = len(message.mentions)
+        mention_count = features.mention_count
         if mention_count > 5:
             score += 3
             factors.append("excessive_mentions")
@@ -153,57 +166,65 @@ class AutomodCog(commands.Cog):
             factors.append("multiple_mentions")
 
         # Caps ratio
-        if message.content:
-            caps_ratio = sum(1 for c in message.content if c.isupper()) / len(message.content)
-            if caps_ratio > 0.7:
-                score += 2
-                factors.append("excessive_caps")
+        if features.caps_ratio > 0.7:
+            score += 2
+            factors.append("excessive_caps")
 
         # Spam patterns
-        spam_patterns = self.detect_spam_patterns(message.content)
+        spam_patterns = self.detect_spam_patterns(features)
         score += len(spam_patterns)
         factors.extend(spam_patterns)
 
         # Context violations
-        context_violations = self.detect_context_violations(message.content)
+        context_violations = self.detect_context_violations(features.lowered)
         score += len(context_violations) * 2
         factors.extend(context_violations)
 
         return score, factors
 
-    def detect_language(self, text):
-        """Detect the language of the text"""
+    def _detect_language_sync(self, text):
+        """Run langdetect (called on the worker thread)"""
         try:
             return detect(text)
         except (LangDetectException, Exception):
             return "unknown"
 
-    def contains_profanity(self, text):
-        """Check if text contains profanity"""
+    async def detect_language(self, text):
+        """Detect the language of the text without blocking the event loop"""
+        normalized = ' '.join(text.split())
+
+        # Detection on very short texts is noise
+        if len(normalized) < Config.LANGDETECT_MIN_LENGTH:
+            return "unknown"
+
+        key = self.content_key(normalized)
+        language = self.language_cache.get(key)
+        if language is not None:
+            return language
+
+        loop = asyncio.get_running_loop()
         try:
-            # Check using better-profanity
-            if profanity.contains_profanity(text):
-                # Find the specific word
-                words = text.split()
-                for word in words:
-                    if profanity.contains_profanity(word):
-                        return True, word
-                return True, "detected"
-            return False, None
-        except Exception as e:
-            print(f"❌ Error checking profanity: {e}")
-            return False, None
+            language = await asyncio.wait_for(
+                loop.run_in_executor(self.language_executor, self._detect_language_sync, normalized),
+                timeout=Config.LANGDETECT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            # Don't cache timeouts, the worker may just be busy
+            return "unknown"
+        except RuntimeError:
+            return "unknown"  # Executor shut down during cog unload
+
+        self.language_cache.set(key, language)
+        return language
 
     @commands.Cog.listener()
-    async def on_message(self, message):
-        # Ignore bot messages and DMs
-        if message.author.bot or not message.guild:
-            return
+    async def on_message_features(self, message, features):
+        # Bot messages and DMs are already filtered out by MessageAnalysisCog
 
         # Don't ignore any user messages - check all content
 
         # Check for profanity
-        contains_bad_word, detected_word = self.contains_profanity(message.content)
+        contains_bad_word, detected_word = self.get_profanity_verdict(features)
 
         if contains_bad_word:
             # Delete the message
@@ -214,13 +235,14 @@ class AutomodCog(commands.Cog):
             except discord.Forbidden:
                 pass  # No permission to delete
 
+            self.bot.dispatch('automod_hit', message, detected_word)
+
             # Get automod log channel
-            log_channel = self.bot.get_channel(Config.AUTOMOD_LOG_CHANNEL)
-            if not log_channel:
+            if not self.bot.get_channel(Config.AUTOMOD_LOG_CHANNEL):
                 return
 
             # Detect language
-            detected_language = self.detect_language(message.content)
+            detected_language = await self.detect_language(features.normalized)
 
             # Create detailed log embed
             embed = discord.Embed(
@@ -253,7 +275,7 @@ class AutomodCog(commands.Cog):
             # Additional information
             embed.add_field(
                 name="📊 Additional Info",
-                value=f"**Message Length:** {len(message.content)} characters\n**Word Count:** {len(message.content.split())} words\n**Channel ID:** {message.channel.id}",
+                value=f"**Message Length:** {len(message.content)} characters\n**Word Count:** {len(features.tokens)} words\n**Channel ID:** {message.channel.id}",
                 inline=False
             )
 
@@ -267,8 +289,8 @@ class AutomodCog(commands.Cog):
             )
             embed.timestamp = discord.utils.utcnow()
 
-            # Send log embed
-            await log_channel.send(embed=embed)
+            # Queue log embed
+            self.bot.log_dispatcher.send_nowait(Config.AUTOMOD_LOG_CHANNEL, embed, severity="medium")
 
             # Send public warning message in the same channel
             warning_messages = [
@@ -282,47 +304,46 @@ class AutomodCog(commands.Cog):
             import random
             warning_msg = random.choice(warning_messages)
 
-            try:
-                warning_embed = discord.Embed(
-                    description=f"{message.author.mention} {warning_msg}",
-                    color=Config.COLORS["warning"]
-                )
-                await message.channel.send(embed=warning_embed, delete_after=10)
-            except discord.Forbidden:
-                pass
+            warning_embed = discord.Embed(
+                description=f"{message.author.mention} {warning_msg}",
+                color=Config.COLORS["warning"]
+            )
+            self.bot.background_tasks.submit(
+                functools.partial(message.channel.send, embed=warning_embed, delete_after=10),
+                name=f"automod warning in channel {message.channel.id}"
+            )
 
             # Also send DM
-            try:
-                dm_embed = discord.Embed(
-                    title="⚠️ Message Removed",
-                    description="Your message was removed for containing inappropriate content.",
-                    color=Config.COLORS["warning"]
-                )
-                dm_embed.add_field(
-                    name="📝 Reason",
-                    value="Inappropriate language detected",
-                    inline=False
-                )
-                dm_embed.add_field(
-                    name="🌴 Monroe Social Club Rules",
-                    value="Please keep our beach club family-friendly and respectful!",
-                    inline=False
-                )
-                dm_embed.set_footer(text="This is an automated message")
-
-                await message.author.send(embed=dm_embed)
-            except discord.Forbidden:
-                pass  # User has DMs disabled
+            dm_embed = discord.Embed(
+                title="⚠️ Message Removed",
+                description="Your message was removed for containing inappropriate content.",
+                color=Config.COLORS["warning"]
+            )
+            dm_embed.add_field(
+                name="📝 Reason",
+                value="Inappropriate language detected",
+                inline=False
+            )
+            dm_embed.add_field(
+                name="🌴 Monroe Social Club Rules",
+                value="Please keep our beach club family-friendly and respectful!",
+                inline=False
+            )
+            dm_embed.set_footer(text="This is an automated message")
 
-async def setup(bot):
-    await bot.add_cog(AutomodCog(bot))
+            self.bot.background_tasks.submit(
+                functools.partial(message.author.send, embed=dm_embed),
+                name=f"automod DM to {message.author.id}"
+            )
 
     @commands.Cog.listener()
     async def on_message_edit(self, before, after):
         """Check edited messages for profanity too"""
         # Only check if content actually changed
-        if before.content != after.content:
-            await self.on_message(after)
+        if before.content == after.content or after.author.bot or not after.guild:
+            return
+
+        await self.on_message_features(after, analyze_message(after))
 
 class AutoModerationSystem:
     async def on_message(self, message):
@@ -343,4 +364,6 @@ class AutoModerationCog(commands.Cog):
         await self.automod.on_message(message)
 
 async def setup(bot):
-    await bot.add_cog(AutoModerationCog(bot))
\ No newline at end of file
+    # AutomodCog deletes messages and warns users server-wide, it is not
+    # registered until enabling it gets its own explicit change
+    await bot.add_cog(AutoModerationCog(bot))
@@ -0,0 +1,115 @@
+import discord
+import asyncio
+from collections import deque
+from datetime import datetime
+from bot.config import Config
+
+class BackgroundTaskQueue:
+    """Supervised queue for fire-and-forget Discord side effects.
+
+    Callers submit a zero-argument factory that returns a fresh coroutine
+    (e.g. ``functools.partial(channel.send, embed=embed)``), so a failed send
+    can be retried with backoff. Workers that die are restarted on the next
+    submit, and failures are kept for inspection.
+    """
+
+    def __init__(self, workers=None, max_queue_size=None, max_retries=None):
+        self.worker_count = workers or Config.BACKGROUND_TASK_WORKERS
+        self.max_queue_size = max_queue_size or Config.BACKGROUND_TASK_QUEUE_SIZE
+        self.max_retries = Config.BACKGROUND_TASK_MAX_RETRIES if max_retries is None else max_retries
+
+        self.queue = None
+        self.workers = []
+        self.retry_tasks = set()
+        self.recent_failures = deque(maxlen=50)
+        self.metrics = {
+            'submitted': 0,
+            'completed': 0,
+            'retried': 0,
+            'failed': 0,
+            'rejected': 0
+        }
+
+    def _ensure_workers(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+
+        # Supervise: replace any worker that has exited
+        self.workers = [worker for worker in self.workers if not worker.done()]
+        while len(self.workers) < self.worker_count:
+            self.workers.append(asyncio.create_task(self._worker()))
+
+    def submit(self, factory, name="task"):
+        """Schedule a side effect without waiting for it, returns False if rejected"""
+        self._ensure_workers()
+        try:
+            self.queue.put_nowait((factory, name, 0))
+        except asyncio.QueueFull:
+            self.metrics['rejected'] += 1
+            self._record_failure(name, "queue full")
+            return False
+
+        self.metrics['submitted'] += 1
+        return True
+
+    def _is_retryable(self, error):
+        # Missing permissions, deleted targets and closed DMs will not fix themselves
+        if isinstance(error, (discord.Forbidden, discord.NotFound)):
+            return False
+        return isinstance(error, (discord.HTTPException, asyncio.TimeoutError, OSError))
+
+    def _record_failure(self, name, error):
+        self.recent_failures.append({
+            'task': name,
+            'error': str(error),
+            'time': datetime.utcnow().isoformat()
+        })
+
+    async def _retry_later(self, factory, name, attempt):
+        await asyncio.sleep(2 ** attempt)
+        try:
+            self.queue.put_nowait((factory, name, attempt + 1))
+        except asyncio.QueueFull:
+            self.metrics['failed'] += 1
+            self._record_failure(name, "queue full on retry")
+
+    async def _worker(self):
+        while True:
+            factory, name, attempt = await self.queue.get()
+            try:
+                await factory()
+                self.metrics['completed'] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable(e):
+                    self.metrics['retried'] += 1
+                    retry_task = asyncio.create_task(self._retry_later(factory, name, attempt))
+                    self.retry_tasks.add(retry_task)
+                    retry_task.add_done_callback(self.retry_tasks.discard)
+                else:
+                    self.metrics['failed'] += 1
+                    self._record_failure(name, e)
+                    print(f"❌ Background task '{name}' failed: {e}")
+            finally:
+                self.queue.task_done()
+
+    def stats(self):
+        """Return queue depth and task counters"""
+        return {
+            'queue_depth': self.queue.qsize() if self.queue else 0,
+            'workers': len(self.workers),
+            **self.metrics
+        }
+
+    async def close(self, timeout=5.0):
+        """Let queued tasks finish, then stop the workers"""
+        if self.queue is not None:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                print("❌ Background task queue closed with tasks still pending")
+
+        for task in [*self.workers, *self.retry_tasks]:
+            task.cancel()
+        self.workers.clear()
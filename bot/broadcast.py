@@ -0,0 +1,77 @@
+import functools
+from collections import OrderedDict
+from bot.config import Config
+from bot.delivery import fan_out
+
+class BroadcastDelivery:
+    """Per-channel progress of one dashboard broadcast"""
+
+    def __init__(self):
+        self.channels = OrderedDict()  # target label -> channel status dict
+        self.targets = []              # (label, factory) pairs still to send
+
+    def add_channel(self, label, channel_id, name, status='pending', error=None):
+        self.channels[label] = {'channel_id': str(channel_id), 'name': name, 'status': status, 'error': error}
+
+    def record(self, result):
+        entry = self.channels[result['target']]
+        entry['status'] = 'sent' if result['success'] else 'failed'
+        entry['error'] = result['error']
+
+    def counts(self):
+        counts = {'pending': 0, 'sent': 0, 'failed': 0, 'skipped': 0}
+        for entry in self.channels.values():
+            counts[entry['status']] += 1
+        return counts
+
+    def to_dict(self):
+        return {
+            **self.counts(),
+            'channels': list(self.channels.values())
+        }
+
+class BroadcastManager:
+    """Delivers dashboard broadcasts.
+
+    Target channels are resolved once up front, then sent to concurrently
+    with at most ``concurrency`` sends in flight. discord.py already waits
+    out per-route rate limits (each channel is its own route), the cap keeps
+    a large broadcast from using up the global request budget.
+    """
+
+    def __init__(self, bot, concurrency=None):
+        self.bot = bot
+        self.concurrency = concurrency or Config.BROADCAST_CONCURRENCY
+
+    def prepare(self, channel_ids, **send_kwargs):
+        """Resolve the target channels, returns a BroadcastDelivery ready to send"""
+        delivery = BroadcastDelivery()
+        for channel_id in dict.fromkeys(channel_ids):
+            label = f"channel:{channel_id}"
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                delivery.add_channel(label, channel_id, None, status='skipped', error='channel not found')
+            elif not channel.permissions_for(channel.guild.me).send_messages:
+                delivery.add_channel(label, channel_id, channel.name, status='skipped', error='missing send permission')
+            else:
+                delivery.add_channel(label, channel_id, channel.name)
+                delivery.targets.append((label, functools.partial(channel.send, **send_kwargs)))
+        return delivery
+
+    async def deliver(self, delivery):
+        """Send a prepared broadcast, progress is recorded as each channel finishes"""
+        targets, delivery.targets = delivery.targets, []
+        results = await fan_out(
+            targets,
+            timeout=Config.BROADCAST_SEND_TIMEOUT,
+            limit=self.concurrency,
+            on_result=delivery.record
+        )
+
+        for result in results:
+            if not result['success']:
+                print(f"❌ Broadcast to {result['target']} failed: {result['error']}")
+
+        sent = delivery.counts()['sent']
+        print(f"✅ Broadcast sent to {sent}/{len(delivery.channels)} channels")
+        return sent
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return the cached value and mark it as recently used"""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        """Return counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+class AsyncTTLCache:
+    """Bounded async cache with TTLs, single-flight and stale-while-revalidate.
+
+    ``get_or_fetch(key, fetcher)`` returns a fresh entry if there is one.
+    Within ``stale_ttl`` after expiry the old value is served immediately while
+    one background refresh runs. Concurrent misses for the same key share a
+    single fetch. A ``None`` result is cached for ``negative_ttl`` only, so
+    fetchers return ``None`` for a real "not found" and raise on errors. A
+    failed fetch stores nothing: the previous entry (if any) is kept and the
+    error reaches the caller, or is dropped for a background refresh.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024, negative_ttl: float = 60, stale_ttl: float = 0):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+
+        self._entries = OrderedDict()  # key -> (value, expires_at, stale_until)
+        self._inflight = {}            # key -> asyncio.Task of the running fetch
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get_or_fetch(self, key, fetcher: Callable[[], Awaitable[Any]]):
+        """Return the cached value for key, calling fetcher() when needed"""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            value, expires_at, stale_until = entry
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            if now < stale_until:
+                # Serve the stale value and refresh it in the background
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._start_fetch(key, fetcher)
+                return value
+
+        self.misses += 1
+        # Shielded so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(self._start_fetch(key, fetcher))
+
+    def _start_fetch(self, key, fetcher):
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        task = asyncio.create_task(self._fetch(key, fetcher))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_fetch(key, done))
+        return task
+
+    def _finish_fetch(self, key, task):
+        self._inflight.pop(key, None)
+        # Mark background refresh errors as retrieved, callers that awaited
+        # the task have already seen them
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    async def _fetch(self, key, fetcher):
+        # Only store on success, if fetcher() raises the existing entry
+        # (e.g. the stale value being refreshed) is left untouched
+        value = await fetcher()
+        self.set(key, value)
+        return value
+
+    def set(self, key, value):
+        """Store a value with the positive or negative TTL"""
+        now = time.monotonic()
+        if value is None:
+            expires_at = stale_until = now + self.negative_ttl
+        else:
+            expires_at = now + self.ttl
+            stale_until = expires_at + self.stale_ttl
+
+        self._entries[key] = (value, expires_at, stale_until)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def stats(self):
+        """Return counters for monitoring"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'inflight': len(self._inflight)
+        }
@@ -27,6 +27,10 @@ class Config:
     ANNOUNCEMENT_CHANNEL = 1353388424295350283    # Replace with actual channel ID
     APPLICATION_LOG_CHANNEL = 1353388424295350283  # Replace with actual channel ID
     DEVLOG_CHANNEL = 1353388424295350283          # Replace with actual channel ID
+    ADMIN_LOG_CHANNEL = 1353388424295350283       # Replace with actual channel ID
+
+    # Moderation actions are logged to both of these channels
+    MODERATION_LOG_CHANNELS = [1353388676981456917, 1387524238117830776]
 
     # Public Channels
     ANNOUNCEMENT_CHANNEL = 1353388424295350283
@@ -67,6 +71,20 @@ class Config:
     ROBLOX_GAME_LINK = "https://www.roblox.com/games/your-game-id"
     ROVER_API_BASE = "https://registry.rover.link/api"
 
+    # Optional /get_profile lookups (headshot, group role) are dropped after this many seconds
+    ROBLOX_OPTIONAL_LOOKUP_TIMEOUT = 4.0
+
+    # Rover/Roblox response caches (seconds). Stale entries are served while a
+    # background refresh runs; empty results (e.g. unverified users) use
+    # negative_ttl. maxsize bounds memory per endpoint for the 0.5 GB plan.
+    ROBLOX_CACHE = {
+        "rover": {"ttl": 600, "stale_ttl": 3600, "negative_ttl": 60, "maxsize": 5000},
+        "user_info": {"ttl": 1800, "stale_ttl": 3600, "negative_ttl": 60, "maxsize": 2000},
+        "headshot": {"ttl": 3600, "stale_ttl": 86400, "negative_ttl": 60, "maxsize": 2000},
+        "group_info": {"ttl": 300, "stale_ttl": 3600, "negative_ttl": 30, "maxsize": 10},
+        "group_role": {"ttl": 600, "stale_ttl": 3600, "negative_ttl": 60, "maxsize": 5000}
+    }
+
     # =============================================================================
     # MODERATION CONFIGURATION
     # =============================================================================
@@ -77,19 +95,84 @@ class Config:
     CAPS_DETECTION_ENABLED = True
     LINK_DETECTION_ENABLED = True
 
+    # Link classification, each rule also covers every subdomain
+    LINK_ALLOWED_DOMAINS = ["roblox.com", "discord.com", "discordapp.com", "youtube.com", "youtu.be", "tenor.com", "giphy.com"]
+    LINK_SHORTENER_DOMAINS = ["bit.ly", "tinyurl.com", "t.co", "goo.gl", "is.gd", "cutt.ly"]
+    LINK_DENIED_DOMAINS = ["grabify.link", "iplogger.org", "iplogger.com", "2no.co", "blasze.tk"]  # IP loggers
+
     # Spam detection thresholds
     SPAM_MESSAGE_COUNT = 5
     SPAM_TIME_WINDOW = 10  # seconds
     SPAM_PUNISHMENT_DURATION = 300  # 5 minutes timeout
 
+    # Profanity matching: True only flags whole words ("shit", not "xshitx"),
+    # False flags any substring, which also catches glued words like "fuckyou"
+    # but hits innocent words too ("class" for "ass", "hello" for "hell")
+    PROFANITY_WHOLE_WORDS = True
+
+    # Automod verdict cache (identical message texts are only scored once)
+    AUTOMOD_VERDICT_CACHE_SIZE = 4096
+
+    # Language detection (runs on a worker thread, results cached by content)
+    LANGDETECT_MIN_LENGTH = 20  # characters, shorter texts report "unknown"
+    LANGDETECT_TIMEOUT = 2.0  # seconds
+    LANGDETECT_CACHE_SIZE = 1024
+
+    # Log delivery (queued per channel, batched up to 10 embeds per message)
+    LOG_QUEUE_MAX_SIZE = 500  # queued embeds per channel before backpressure
+    LOG_FLUSH_INTERVAL = 2.0  # seconds to wait for a batch to fill
+
+    # Concurrent multi-target delivery (moderation logs, DMs)
+    FANOUT_TIMEOUT = 5.0  # seconds per target
+
+    # Dashboard broadcasts
+    BROADCAST_CONCURRENCY = 5  # sends in flight at once
+    BROADCAST_SEND_TIMEOUT = 15.0  # seconds per channel, rate limit waits included
+
+    # Dashboard actions run as background jobs, polled through /api/jobs/{id}
+    DASHBOARD_JOB_WORKERS = 2
+    DASHBOARD_JOB_QUEUE_SIZE = 100
+    DASHBOARD_JOB_HISTORY = 200  # finished jobs (and their idempotency keys) kept for polling
+
+    # /api/status snapshot refresh (also the Cache-Control max-age)
+    STATUS_REFRESH_INTERVAL = 5  # seconds
+    # Gauges are reported in steps so jitter does not change the ETag every tick
+    STATUS_LATENCY_STEP_MS = 50
+    STATUS_LOOP_LAG_STEP_MS = 10
+
+    # Dashboard live feed (/api/live, Server-Sent Events)
+    LIVE_FEED_CLIENT_BUFFER = 100  # events buffered per viewer, oldest dropped first
+    LIVE_FEED_MAX_CLIENTS = 50
+    LIVE_FEED_HEARTBEAT = 15  # seconds between keepalive comments
+    LIVE_FEED_TOKEN_TTL = 60  # seconds a feed token from /api/live/token can open streams
+
+    # Background side-effect sends (logs, announcements, DMs)
+    BACKGROUND_TASK_WORKERS = 4
+    BACKGROUND_TASK_QUEUE_SIZE = 1000
+    BACKGROUND_TASK_MAX_RETRIES = 3  # retries with 1s/2s/4s backoff
+
     # Caps detection settings
     CAPS_THRESHOLD = 0.7  # 70% caps
     CAPS_MIN_LENGTH = 10  # minimum message length to check
 
     # Suspicious activity detection
     SUSPICIOUS_ACTIVITY_ENABLED = True
+    SUSPICIOUS_KEYWORDS = [
+        'raid', 'nuke', 'destroy server', 'delete everything', 'crash bot',
+        'mass ban', 'exploit', 'hack', 'ddos', 'doxx', 'token grab',
+        'server crash', 'mass kick', 'admin panel', 'backdoor'
+    ]
     RAID_DETECTION_THRESHOLD = 5  # users joining within time window
     RAID_DETECTION_TIME_WINDOW = 30  # seconds
+    RAID_ALERT_DELAY = 5  # seconds to collect a burst of joins before the first raid alert
+    RAID_CLUSTER_CREATION_GAP = 3600  # seconds between account creation times within one cluster
+    RAID_LOCKDOWN_ENABLED = os.getenv("RAID_LOCKDOWN_ENABLED", "False").lower() == "true"
+    RAID_LOCKDOWN_VERIFICATION_LEVEL = discord.VerificationLevel.highest  # restored when the raid ends
+
+    # Suspicious activity alert throttling, per user and alert type
+    SUSPICIOUS_ALERT_COOLDOWN = 300  # seconds between alerts, doubles with each escalation
+    SUSPICIOUS_ALERT_MAX_COOLDOWN = 3600
+    SUSPICIOUS_ALERT_ESCALATE_AFTER = 10  # suppressed events within one cooldown that escalate the alert
 
     # Server Rules
     SERVER_RULES = {
@@ -272,6 +355,12 @@ class Config:
     LEADERBOARD_ENABLED = True
     LEADERBOARD_RESET_WEEKLY = True
     LEADERBOARD_MAX_ENTRIES = 10
+    LEADERBOARD_TRACKED_USERS = 100  # users kept ranked per category, leaves headroom for filtering to guild members
+
+    # Activity persistence ("sqlite" or "memory" for local runs)
+    ACTIVITY_STORE_BACKEND = os.getenv('ACTIVITY_STORE_BACKEND', 'sqlite')
+    ACTIVITY_DB_PATH = os.getenv('ACTIVITY_DB_PATH', 'data/activity.db')
+    ACTIVITY_FLUSH_INTERVAL = 60  # seconds between batched writes of changed users
 
     # Point values for different activities
     ACTIVITY_POINTS = {
@@ -293,6 +382,14 @@ class Config:
     API_PORT = int(os.getenv('PORT', 8000))
     API_HOST = "0.0.0.0"
 
+    # Shared outbound HTTP client (Rover, Roblox, keep-alive)
+    HTTP_POOL_SIZE = 50  # total pooled connections
+    HTTP_POOL_SIZE_PER_HOST = 10
+    HTTP_DNS_CACHE_TTL = 300  # seconds
+    HTTP_KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+    HTTP_TIMEOUT = 15  # seconds per request
+    HTTP_CONNECT_TIMEOUT = 5  # seconds
+
     # Dashboard authentication
     DASHBOARD_SECRET_KEY = os.getenv("DASHBOARD_SECRET", "monroe-secret-key-2024")
 
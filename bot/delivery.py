@@ -0,0 +1,55 @@
+import asyncio
+import functools
+from bot.config import Config
+
+async def _deliver(label, factory, timeout):
+    try:
+        await asyncio.wait_for(factory(), timeout=timeout)
+        return {'target': label, 'success': True, 'error': None}
+    except asyncio.TimeoutError:
+        return {'target': label, 'success': False, 'error': f'timed out after {timeout}s'}
+    except Exception as e:
+        return {'target': label, 'success': False, 'error': str(e) or type(e).__name__}
+
+async def fan_out(targets, timeout=None, limit=None, on_result=None):
+    """Run deliveries concurrently with a per-target timeout.
+
+    ``targets`` is a list of ``(label, factory)`` pairs where each factory
+    returns a fresh coroutine. Returns one result dict per target, in order:
+    ``{'target': label, 'success': bool, 'error': str or None}``.
+
+    ``limit`` caps how many deliveries are in flight at once (the timeout
+    starts once a slot is free) and ``on_result`` is called with each result
+    as it completes, for progress reporting.
+    """
+    timeout = timeout or Config.FANOUT_TIMEOUT
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(label, factory):
+        if semaphore:
+            async with semaphore:
+                result = await _deliver(label, factory, timeout)
+        else:
+            result = await _deliver(label, factory, timeout)
+        if on_result:
+            on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(run(label, factory) for label, factory in targets)))
+
+async def send_to_channels(bot, channel_ids, timeout=None, **send_kwargs):
+    """Send the same message to several channels concurrently"""
+    targets = []
+    missing = []
+    for channel_id in channel_ids:
+        channel = bot.get_channel(channel_id)
+        if channel:
+            targets.append((f"channel:{channel_id}", functools.partial(channel.send, **send_kwargs)))
+        else:
+            missing.append({'target': f"channel:{channel_id}", 'success': False, 'error': 'channel not found'})
+
+    return await fan_out(targets, timeout=timeout) + missing
+
+def count_delivered(results):
+    """Number of successful deliveries in a fan_out result list"""
+    return sum(1 for result in results if result['success'])
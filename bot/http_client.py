@@ -0,0 +1,26 @@
+import aiohttp
+from bot.config import Config
+
+def create_http_session():
+    """Create the bot-wide aiohttp session for all outbound HTTP.
+
+    One pooled connector means keep-alive connections and cached DNS lookups
+    are reused across Rover, Roblox and keep-alive requests instead of paying
+    a new TCP+TLS handshake per call. Must be created inside the running loop
+    and closed on shutdown.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=Config.HTTP_POOL_SIZE,
+        limit_per_host=Config.HTTP_POOL_SIZE_PER_HOST,
+        ttl_dns_cache=Config.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=Config.HTTP_KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=Config.HTTP_TIMEOUT,
+        connect=Config.HTTP_CONNECT_TIMEOUT
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={'User-Agent': f"MonroeBot/{Config.BOT_VERSION}"}
+    )
@@ -0,0 +1,155 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from bot.config import Config
+
+class Job:
+    """One queued dashboard action and its outcome"""
+
+    def __init__(self, kind, handler, idempotency_key=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.handler = handler
+        self.idempotency_key = idempotency_key
+        self.status = 'queued'
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.progress = None  # optional object with to_dict(), e.g. per-channel broadcast status
+
+    @property
+    def done(self):
+        return self.status in ('succeeded', 'failed')
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'result': self.result,
+            'error': self.error,
+            'progress': self.progress.to_dict() if self.progress else None
+        }
+
+class JobQueue:
+    """In-process queue for dashboard actions.
+
+    HTTP handlers validate a request, submit a handler coroutine function and
+    answer with the job id straight away. Workers run the handlers in order
+    and keep the result for ``GET /api/jobs/{id}``. Requests carrying an
+    idempotency key that is already known get the existing job back, so a
+    retried request never posts twice. Only the newest ``history`` jobs are
+    kept, along with their keys.
+    """
+
+    def __init__(self, workers=None, max_queue_size=None, history=None):
+        self.worker_count = workers or Config.DASHBOARD_JOB_WORKERS
+        self.max_queue_size = max_queue_size or Config.DASHBOARD_JOB_QUEUE_SIZE
+        self.history = history or Config.DASHBOARD_JOB_HISTORY
+
+        self.queue = None
+        self.workers = []
+        self.jobs = OrderedDict()  # job id -> Job, oldest first
+        self.idempotency_keys = {}  # (kind, key) -> job id
+        self.metrics = {
+            'submitted': 0,
+            'duplicates': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'rejected': 0
+        }
+
+    def _ensure_workers(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+
+        self.workers = [worker for worker in self.workers if not worker.done()]
+        while len(self.workers) < self.worker_count:
+            self.workers.append(asyncio.create_task(self._worker()))
+
+    def submit(self, kind, handler, idempotency_key=None):
+        """Queue ``handler(job)``, returns ``(job, created)`` or ``(None, False)`` if the queue is full"""
+        if idempotency_key:
+            job_id = self.idempotency_keys.get((kind, idempotency_key))
+            if job_id is not None:
+                self.metrics['duplicates'] += 1
+                return self.jobs[job_id], False
+
+        self._ensure_workers()
+        job = Job(kind, handler, idempotency_key)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.metrics['rejected'] += 1
+            return None, False
+
+        self.metrics['submitted'] += 1
+        self.jobs[job.id] = job
+        if idempotency_key:
+            self.idempotency_keys[(kind, idempotency_key)] = job.id
+        self._trim_history()
+        return job, True
+
+    def _trim_history(self):
+        # Only finished jobs are dropped, queued ones must stay reachable
+        while len(self.jobs) > self.history:
+            job_id, job = next(iter(self.jobs.items()))
+            if not job.done:
+                break
+            del self.jobs[job_id]
+            if job.idempotency_key:
+                self.idempotency_keys.pop((job.kind, job.idempotency_key), None)
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def _worker(self):
+        while True:
+            job = await self.queue.get()
+            job.status = 'running'
+            job.started_at = datetime.utcnow()
+            try:
+                job.result = await job.handler(job)
+                job.status = 'succeeded'
+                self.metrics['succeeded'] += 1
+            except asyncio.CancelledError:
+                job.status = 'failed'
+                job.error = 'cancelled'
+                raise
+            except Exception as e:
+                job.status = 'failed'
+                job.error = str(e) or type(e).__name__
+                self.metrics['failed'] += 1
+                print(f"❌ Dashboard {job.kind} job {job.id} failed: {job.error}")
+            finally:
+                job.finished_at = datetime.utcnow()
+                job.handler = None
+                self.queue.task_done()
+                self._trim_history()
+
+    def stats(self):
+        """Return queue depth and job counters"""
+        return {
+            'queue_depth': self.queue.qsize() if self.queue else 0,
+            'workers': len(self.workers),
+            'tracked_jobs': len(self.jobs),
+            **self.metrics
+        }
+
+    async def close(self, timeout=10.0):
+        """Let queued jobs finish, then stop the workers"""
+        if self.queue is not None:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                print("❌ Dashboard job queue closed with jobs still pending")
+
+        for task in self.workers:
+            task.cancel()
+        self.workers.clear()
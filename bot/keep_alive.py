@@ -1,5 +1,4 @@
 import asyncio
-import aiohttp
 from discord.ext import commands, tasks
 
 class KeepAlive(commands.Cog):
@@ -14,11 +13,10 @@ class KeepAlive(commands.Cog):
     async def keep_alive_task(self):
         """Keep alive ping every 5 minutes"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Ping a reliable service to keep the bot alive
-                async with session.get('https://httpbin.org/get') as response:
-                    if response.status == 200:
-                        print("🏖️ Keep alive ping successful")
+            # Ping a reliable service to keep the bot alive
+            async with self.bot.http_session.get('https://httpbin.org/get') as response:
+                if response.status == 200:
+                    print("🏖️ Keep alive ping successful")
         except Exception as e:
             print(f"❌ Keep alive ping failed: {e}")
     
@@ -0,0 +1,170 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from bot.config import Config
+
+# Invite links: any path on discord.gg, /invite/ paths on the main domains
+INVITE_HOSTS = {'discord.gg'}
+INVITE_PATH_HOSTS = {'discord.com', 'discordapp.com'}
+
+TRAILING_PUNCTUATION = '.,;:!?)]}>\'"'
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+# Alternatives of the scan pattern, matched against lowercased text. Links and
+# keywords share one lookbehind so most positions are rejected after one check.
+URL_FRAGMENT = r'(?P<url>https?://\S+|(?:[a-z0-9-]+\.)+[a-z]{2,}(?:/\S*)?)'
+MENTION_FRAGMENT = r'(?P<mention><@[!&]?\d+>)'
+
+def canonicalize_url(raw):
+    """Return ``(host, url)`` for a link as typed in a message.
+
+    The host is lowercased, IDNA-encoded and stripped of ``www.``, userinfo
+    and trailing dots, so ``HTTPS://user@WWW.Bit.ly./x`` and ``bit.ly/x``
+    resolve to the same rule. Tracking parameters and fragments are dropped.
+    """
+    raw = raw.rstrip(TRAILING_PUNCTUATION)
+    if '://' not in raw:
+        raw = 'https://' + raw
+
+    try:
+        parts = urlsplit(raw)
+        host = (parts.hostname or '').rstrip('.')
+        port = parts.port
+    except ValueError:
+        return None, raw
+
+    try:
+        host = host.encode('idna').decode('ascii')
+    except UnicodeError:
+        pass
+    if host.startswith('www.'):
+        host = host[4:]
+
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ])
+    return host, urlunsplit(('https', netloc, parts.path.rstrip('/'), query, ''))
+
+class DomainTrie:
+    """Domain rules stored by reversed labels (``ly`` -> ``bit``).
+
+    A rule covers the domain and every subdomain, and the most specific rule
+    wins, so a lookup walks at most one node per label of the host however
+    many rules there are.
+    """
+
+    def __init__(self, rules=None):
+        self.root = {}
+        for domain, verdict in (rules or {}).items():
+            self.add(domain, verdict)
+
+    def add(self, domain, verdict):
+        node = self.root
+        for label in reversed(domain.lower().strip('.').split('.')):
+            node = node.setdefault(label, {})
+        node[''] = verdict
+
+    def lookup(self, host):
+        """Return the verdict of the most specific rule covering host, or None"""
+        node = self.root
+        verdict = None
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            verdict = node.get('', verdict)
+        return verdict
+
+class LinkScan:
+    """Everything the classifier found in one message"""
+
+    __slots__ = ('links', 'invites', 'shorteners', 'denied', 'keywords', 'mentions')
+
+    def __init__(self):
+        self.links = []       # canonical URLs
+        self.invites = []     # canonical invite URLs
+        self.shorteners = []  # hosts of link shorteners
+        self.denied = []      # hosts on the deny list
+        self.keywords = []    # suspicious keywords, lowercased, first occurrence order
+        self.mentions = 0     # raw <@id> / <@&id> mention tokens
+
+    @property
+    def suspicious_links(self):
+        return bool(self.invites or self.shorteners or self.denied)
+
+class LinkClassifier:
+    """Single precompiled scanner for links, mentions and keywords.
+
+    Links, mention tokens and keywords are alternatives of one regex, so a
+    message is scanned once and every match is reported. Each link is
+    canonicalized and checked against a DomainTrie. Links without a scheme
+    only count when their domain has a rule, so ``file.txt`` is not a link.
+    """
+
+    def __init__(self, allowed=(), shorteners=(), denied=(), keywords=()):
+        rules = {host: 'invite' for host in INVITE_HOSTS}
+        rules.update((domain, 'allow') for domain in allowed)
+        rules.update((domain, 'shortener') for domain in shorteners)
+        rules.update((domain, 'deny') for domain in denied)
+        self.domains = DomainTrie(rules)
+
+        word_fragments = [URL_FRAGMENT]
+        if keywords:
+            # Longest first so "mass ban" wins over a shorter overlapping keyword
+            words = sorted({' '.join(word.lower().split()) for word in keywords}, key=len, reverse=True)
+            word_fragments.append(r'(?P<keyword>' + '|'.join(re.escape(word) for word in words) + ')')
+        self.pattern = re.compile(r'(?<![\w.@/-])(?:' + '|'.join(word_fragments) + ')|' + MENTION_FRAGMENT)
+
+    def scan(self, text, lowered=None):
+        """Classify every link, mention and keyword in whitespace-normalized text.
+
+        Matching runs on the lowercased text (pass it in if already computed),
+        links are cut from the original so paths and invite codes keep their case.
+        """
+        lowered = text.lower() if lowered is None else lowered
+        source = text if len(text) == len(lowered) else lowered
+
+        result = LinkScan()
+        seen_keywords = set()
+        for match in self.pattern.finditer(lowered):
+            kind = match.lastgroup
+            if kind == 'mention':
+                result.mentions += 1
+            elif kind == 'keyword':
+                keyword = match.group('keyword')
+                if keyword not in seen_keywords:
+                    seen_keywords.add(keyword)
+                    result.keywords.append(keyword)
+            else:
+                self._classify_link(source[match.start():match.end()], result)
+        return result
+
+    def _classify_link(self, raw, result):
+        host, url = canonicalize_url(raw)
+        if not host:
+            return
+
+        verdict = self.domains.lookup(host)
+        if verdict is None and '://' not in raw:
+            return
+
+        result.links.append(url)
+        if verdict == 'invite' or (host in INVITE_PATH_HOSTS and urlsplit(url).path.startswith('/invite/')):
+            result.invites.append(url)
+        elif verdict == 'shortener':
+            result.shorteners.append(host)
+        elif verdict == 'deny':
+            result.denied.append(host)
+
+def build_classifier():
+    """Build the classifier from the link and keyword lists in Config"""
+    return LinkClassifier(
+        allowed=Config.LINK_ALLOWED_DOMAINS,
+        shorteners=Config.LINK_SHORTENER_DOMAINS,
+        denied=Config.LINK_DENIED_DOMAINS,
+        keywords=Config.SUSPICIOUS_KEYWORDS
+    )
+
+# Shared by message analysis, automod and suspicious activity
+classifier = build_classifier()
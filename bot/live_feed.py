@@ -0,0 +1,182 @@
+import asyncio
+import json
+import secrets
+import time
+from collections import deque
+from datetime import datetime
+from aiohttp import web
+from discord.ext import commands
+from bot.config import Config
+
+class FeedClient:
+    """One connected dashboard viewer with a bounded buffer of encoded events"""
+
+    __slots__ = ('buffer', 'ready', 'dropped')
+
+    def __init__(self, size):
+        self.buffer = deque(maxlen=size)
+        self.ready = asyncio.Event()
+        self.dropped = 0  # events lost to overflow since the last write
+
+    def push(self, frame):
+        # A full deque discards its oldest frame on append
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(frame)
+        self.ready.set()
+
+    def drain(self):
+        frames = list(self.buffer)
+        dropped = self.dropped
+        self.buffer.clear()
+        self.dropped = 0
+        self.ready.clear()
+        return frames, dropped
+
+class LiveFeed:
+    """Server-Sent Events fan-out for the dashboard.
+
+    Each event is encoded once and the same bytes are appended to every
+    client's buffer, so publishing costs one encode plus one append per
+    viewer. Buffers are bounded deques: a client that reads too slowly
+    loses its oldest events and gets an ``overflow`` event with the count
+    instead of holding up the publisher or growing without limit.
+    """
+
+    def __init__(self, buffer_size=None, max_clients=None, heartbeat=None, token_ttl=None):
+        self.buffer_size = buffer_size or Config.LIVE_FEED_CLIENT_BUFFER
+        self.max_clients = max_clients or Config.LIVE_FEED_MAX_CLIENTS
+        self.heartbeat = heartbeat or Config.LIVE_FEED_HEARTBEAT
+        self.token_ttl = token_ttl or Config.LIVE_FEED_TOKEN_TTL
+        self.clients = set()
+        self.tokens = {}  # feed token -> time.monotonic() it expires at
+        self.event_id = 0
+        self.metrics = {
+            'published': 0,
+            'dropped': 0,
+            'rejected': 0
+        }
+
+    def issue_token(self):
+        """Return a short-lived token that only opens live feed streams.
+
+        EventSource cannot send an Authorization header, so browsers pass
+        this in the query string instead of the API secret.
+        """
+        now = time.monotonic()
+        self.tokens = {token: expires for token, expires in self.tokens.items() if expires > now}
+        token = secrets.token_urlsafe(24)
+        self.tokens[token] = now + self.token_ttl
+        return token
+
+    def check_token(self, token):
+        expires = self.tokens.get(token) if token else None
+        return expires is not None and expires > time.monotonic()
+
+    def encode(self, event, data, numbered=True):
+        # Only published events get an id, so ids stay in order for every client
+        frame = f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        if numbered:
+            self.event_id += 1
+            frame = f"id: {self.event_id}\n" + frame
+        return frame.encode('utf-8')
+
+    def publish(self, event, data):
+        """Queue an event for every connected client"""
+        if not self.clients:
+            return
+        frame = self.encode(event, data)
+        for client in self.clients:
+            client.push(frame)
+        self.metrics['published'] += 1
+
+    async def stream(self, request, initial=None):
+        """Serve one SSE connection until the client goes away.
+
+        ``initial`` is an optional ``(event, data)`` pair sent first, e.g. the
+        full status so later deltas have something to apply to.
+        """
+        if len(self.clients) >= self.max_clients:
+            self.metrics['rejected'] += 1
+            return web.json_response({'error': 'Too many live feed clients'}, status=503)
+
+        response = web.StreamResponse(headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+        await response.prepare(request)
+
+        client = FeedClient(self.buffer_size)
+        self.clients.add(client)
+        try:
+            if initial:
+                client.push(self.encode(*initial, numbered=False))
+
+            while True:
+                try:
+                    await asyncio.wait_for(client.ready.wait(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+
+                frames, dropped = client.drain()
+                if dropped:
+                    self.metrics['dropped'] += dropped
+                    frames.insert(0, self.encode('overflow', {'dropped': dropped}, numbered=False))
+                await response.write(b''.join(frames))
+        except (ConnectionResetError, RuntimeError):
+            # Client disconnected (RuntimeError: writing to a closed transport)
+            pass
+        finally:
+            self.clients.discard(client)
+        return response
+
+    def stats(self):
+        return {
+            'clients': len(self.clients),
+            **self.metrics
+        }
+
+def describe_user(user):
+    if user is None:
+        return None
+    return {'id': str(user.id), 'name': str(user)}
+
+class LiveFeedCog(commands.Cog):
+    """Publishes moderation, automod and suspicious-activity events to the live feed"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_moderation_action(self, action, target, staff, reason):
+        self.bot.live_feed.publish('moderation', {
+            'action': action,
+            'target': describe_user(target),
+            'staff': staff,
+            'reason': reason,
+            'time': datetime.utcnow().isoformat()
+        })
+
+    @commands.Cog.listener()
+    async def on_automod_hit(self, message, detected_word):
+        self.bot.live_feed.publish('automod', {
+            'user': describe_user(message.author),
+            'channel': {'id': str(message.channel.id), 'name': getattr(message.channel, 'name', None)},
+            'word': detected_word,
+            'time': datetime.utcnow().isoformat()
+        })
+
+    @commands.Cog.listener()
+    async def on_suspicious_alert(self, user, activity_type, description, severity):
+        self.bot.live_feed.publish('suspicious', {
+            'user': describe_user(user),
+            'type': activity_type,
+            'description': description,
+            'severity': severity,
+            'time': datetime.utcnow().isoformat()
+        })
+
+async def setup(bot):
+    await bot.add_cog(LiveFeedCog(bot))
@@ -0,0 +1,178 @@
+import discord
+import asyncio
+from bot.config import Config
+
+# Discord limits for a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+class LogDispatcher:
+    """Queued, batched delivery of log embeds to Discord channels.
+
+    Each channel gets its own queue and worker. The worker packs up to 10
+    embeds per message and flushes when a batch fills or the flush interval
+    runs out. When a queue is saturated, low-severity entries are dropped and
+    rolled up into a single summary embed. Everything else waits for room in
+    ``send`` (backpressure), while ``send_nowait`` drops into the same
+    summary once the queue is completely full.
+    """
+
+    def __init__(self, bot, max_queue_size=None, flush_interval=None):
+        self.bot = bot
+        self.max_queue_size = max_queue_size or Config.LOG_QUEUE_MAX_SIZE
+        self.flush_interval = flush_interval or Config.LOG_FLUSH_INTERVAL
+        self.high_watermark = max(1, int(self.max_queue_size * 0.75))
+
+        self.queues = {}       # Channel ID -> asyncio.Queue of embeds
+        self.workers = {}      # Channel ID -> worker task
+        self.suppressed = {}   # Channel ID -> low-severity entries dropped since the last summary
+        self.metrics = {
+            'enqueued': 0,
+            'dropped': 0,
+            'sent_embeds': 0,
+            'sent_messages': 0,
+            'failed': 0
+        }
+
+    def _get_queue(self, channel_id):
+        queue = self.queues.get(channel_id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self.queues[channel_id] = queue
+            self.suppressed[channel_id] = 0
+            self.workers[channel_id] = asyncio.create_task(self._worker(channel_id, queue))
+        return queue
+
+    def _drop_if_saturated(self, channel_id, queue, severity):
+        if SEVERITY_ORDER.get(severity, 1) == 0 and queue.qsize() >= self.high_watermark:
+            self.suppressed[channel_id] += 1
+            self.metrics['dropped'] += 1
+            return True
+        return False
+
+    async def send(self, channel_id, embed, severity="medium"):
+        """Queue an embed for a channel, returns False if it was dropped"""
+        queue = self._get_queue(channel_id)
+        if self._drop_if_saturated(channel_id, queue, severity):
+            return False
+
+        self.metrics['enqueued'] += 1
+        await queue.put(embed)  # Waits for room when the queue is full
+        return True
+
+    def send_nowait(self, channel_id, embed, severity="medium"):
+        """Queue an embed without ever blocking the caller.
+
+        If the queue is full the entry is dropped and counted in the next
+        suppressed-entries summary, nothing waits for room.
+        """
+        queue = self._get_queue(channel_id)
+        if self._drop_if_saturated(channel_id, queue, severity):
+            return False
+
+        try:
+            queue.put_nowait(embed)
+        except asyncio.QueueFull:
+            self.suppressed[channel_id] += 1
+            self.metrics['dropped'] += 1
+            return False
+
+        self.metrics['enqueued'] += 1
+        return True
+
+    def _summary_embed(self, count):
+        embed = discord.Embed(
+            title="📉 Log Entries Suppressed",
+            description=f"{count} log entries were dropped while the log queue was saturated.",
+            color=Config.COLORS["warning"],
+            timestamp=discord.utils.utcnow()
+        )
+        embed.set_footer(text="Monroe Social Club - Log Dispatcher")
+        return embed
+
+    async def _worker(self, channel_id, queue):
+        loop = asyncio.get_running_loop()
+        carry = None  # Embed that did not fit in the previous batch
+
+        while True:
+            try:
+                if carry is None:
+                    carry = await queue.get()
+                batch, carry = [carry], None
+                batch_chars = len(batch[0])
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        embed = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                    if batch_chars + len(embed) > MAX_EMBED_CHARS_PER_MESSAGE:
+                        carry = embed
+                        break
+                    batch.append(embed)
+                    batch_chars += len(embed)
+
+                taken = len(batch)
+
+                # Roll up dropped entries once the burst is over
+                suppressed = self.suppressed[channel_id]
+                if suppressed and len(batch) < MAX_EMBEDS_PER_MESSAGE and queue.qsize() < self.high_watermark:
+                    summary = self._summary_embed(suppressed)
+                    if batch_chars + len(summary) <= MAX_EMBED_CHARS_PER_MESSAGE:
+                        batch.append(summary)
+                        self.suppressed[channel_id] = 0
+
+                await self._deliver(channel_id, batch)
+
+                # The carried embed stays outstanding until its own batch goes out
+                for _ in range(taken):
+                    queue.task_done()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Log dispatcher error for channel {channel_id}: {e}")
+
+    async def _deliver(self, channel_id, batch):
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            self.metrics['failed'] += len(batch)
+            return
+
+        try:
+            await channel.send(embeds=batch)
+            self.metrics['sent_embeds'] += len(batch)
+            self.metrics['sent_messages'] += 1
+        except Exception as e:
+            self.metrics['failed'] += len(batch)
+            print(f"Failed to send log batch to channel {channel_id}: {e}")
+
+    def stats(self):
+        """Return queue depth and delivery counters"""
+        return {
+            'queue_depth': sum(queue.qsize() for queue in self.queues.values()),
+            'queues': {channel_id: queue.qsize() for channel_id, queue in self.queues.items()},
+            **self.metrics
+        }
+
+    async def close(self, timeout=5.0):
+        """Flush pending entries and stop the workers"""
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self.queues.values())),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            print("❌ Log dispatcher closed with entries still queued")
+
+        for worker in self.workers.values():
+            worker.cancel()
+        self.workers.clear()
+        self.queues.clear()
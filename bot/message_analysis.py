@@ -0,0 +1,66 @@
+from discord.ext import commands
+import time
+from bot.link_classifier import classifier
+
+class MessageFeatures:
+    """Per-message features computed once and shared by every subscriber"""
+
+    __slots__ = (
+        'content', 'normalized', 'lowered', 'tokens', 'mention_count',
+        'caps_ratio', 'scan', 'invite_links', 'links', 'timestamp'
+    )
+
+    def __init__(self, message):
+        self.content = message.content
+        self.normalized = ' '.join(self.content.split())
+        self.lowered = self.normalized.lower()
+        self.tokens = self.lowered.split()
+        self.mention_count = len(message.mentions)
+        self.caps_ratio = (
+            sum(1 for c in self.content if c.isupper()) / len(self.content)
+            if self.content else 0.0
+        )
+        # Links, mention tokens and keywords in a single classifier pass
+        self.scan = classifier.scan(self.normalized, self.lowered)
+        self.invite_links = self.scan.invites
+        self.links = self.scan.links
+        self.timestamp = int(time.time())  # unix seconds, read once for every subscriber
+
+def analyze_message(message):
+    """Compute the shared features for a message"""
+    return MessageFeatures(message)
+
+class MessageAnalysisCog(commands.Cog):
+    """Single on_message stage for guild messages from real users.
+
+    Features are computed once and handed to subscribers through the
+    ``on_message_features(message, features)`` event.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.messages_analyzed = 0
+        self.analysis_seconds = 0.0
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        # Ignore bot messages and DMs for every subscriber
+        if message.author.bot or not message.guild:
+            return
+
+        started = time.perf_counter()
+        features = analyze_message(message)
+        self.analysis_seconds += time.perf_counter() - started
+        self.messages_analyzed += 1
+
+        self.bot.dispatch('message_features', message, features)
+
+    def stats(self):
+        """Return per-message analysis cost counters"""
+        return {
+            'messages_analyzed': self.messages_analyzed,
+            'avg_analysis_us': round(self.analysis_seconds / self.messages_analyzed * 1_000_000, 1) if self.messages_analyzed else 0.0
+        }
+
+async def setup(bot):
+    await bot.add_cog(MessageAnalysisCog(bot))
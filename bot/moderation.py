@@ -4,6 +4,8 @@ from discord import app_commands
 from bot.config import Config
 from bot.embeds import create_moderation_embed, create_error_embed, create_success_embed
 import datetime
+import functools
+from bot.delivery import send_to_channels
 
 class RuleViolationSelect(discord.ui.Select):
     def __init__(self, action_type, target, staff_member, image=None):
@@ -59,6 +61,9 @@ class RuleViolationSelect(discord.ui.Select):
                 await interaction.response.send_message("❌ I don't have permission to kick this user.", ephemeral=True)
                 return
 
+        # Notify listeners such as the dashboard live feed
+        interaction.client.dispatch('moderation_action', self.action_type, self.target, str(self.staff_member), reason)
+
         # Create moderation embed for logs
         log_embed = create_moderation_embed(
             action=self.action_type,
@@ -72,68 +77,66 @@ class RuleViolationSelect(discord.ui.Select):
             log_embed.set_image(url=self.image.url)
 
         # Log to both moderation log channels
-        log_channels = [
-            interaction.client.get_channel(1353388676981456917),
-            interaction.client.get_channel(1387524238117830776)
-        ]
+        log_channels = [interaction.client.get_channel(channel_id) for channel_id in Config.MODERATION_LOG_CHANNELS]
 
         for log_channel in log_channels:
             if log_channel:
-                try:
-                    await log_channel.send(embed=log_embed)
-                except Exception as e:
-                    print(f"Failed to send log to channel {log_channel.id}: {e}")
+                interaction.client.background_tasks.submit(
+                    functools.partial(log_channel.send, embed=log_embed),
+                    name=f"moderation log to channel {log_channel.id}"
+                )
 
         # Send public announcement to the first channel for all actions
         announcement_channel = interaction.client.get_channel(1353388676981456917)
         if announcement_channel:
-            try:
-                # Create public announcement embed
-                announcement_embed = discord.Embed(
-                    title=f"📋 {self.action_type} Issued",
-                    description=f"{self.target.mention} has been {self.action_type.lower()}ed.",
-                    color=color
-                )
-                announcement_embed.add_field(name="Reason", value=reason, inline=False)
-                announcement_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
-                announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
-                announcement_embed.timestamp = discord.utils.utcnow()
+            # Create public announcement embed
+            announcement_embed = discord.Embed(
+                title=f"📋 {self.action_type} Issued",
+                description=f"{self.target.mention} has been {self.action_type.lower()}ed.",
+                color=color
+            )
+            announcement_embed.add_field(name="Reason", value=reason, inline=False)
+            announcement_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
+            announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
+            announcement_embed.timestamp = discord.utils.utcnow()
 
-                if self.image:
-                    announcement_embed.set_image(url=self.image.url)
+            if self.image:
+                announcement_embed.set_image(url=self.image.url)
 
-                await announcement_channel.send(embed=announcement_embed)
-            except Exception as e:
-                print(f"Failed to send announcement to channel {announcement_channel.id}: {e}")
+            interaction.client.background_tasks.submit(
+                functools.partial(announcement_channel.send, embed=announcement_embed),
+                name=f"moderation announcement to channel {announcement_channel.id}"
+            )
 
         # Send DM to user
-        try:
-            if self.action_type == "Warning":
-                dm_embed = discord.Embed(
-                    title="⚠️ Warning - Monroe Social Club",
-                    description=f"You have been warned in Monroe Social Club.",
-                    color=color
-                )
-            elif self.action_type == "Ban":
-                dm_embed = discord.Embed(
-                    title="🔨 Banned - Monroe Social Club",
-                    description=f"You have been banned from Monroe Social Club.",
-                    color=color
-                )
-            elif self.action_type == "Kick":
-                dm_embed = discord.Embed(
-                    title="👢 Kicked - Monroe Social Club",
-                    description=f"You have been kicked from Monroe Social Club.",
-                    color=color
-                )
+        if self.action_type == "Warning":
+            dm_embed = discord.Embed(
+                title="⚠️ Warning - Monroe Social Club",
+                description=f"You have been warned in Monroe Social Club.",
+                color=color
+            )
+        elif self.action_type == "Ban":
+            dm_embed = discord.Embed(
+                title="🔨 Banned - Monroe Social Club",
+                description=f"You have been banned from Monroe Social Club.",
+                color=color
+            )
+        elif self.action_type == "Kick":
+            dm_embed = discord.Embed(
+                title="👢 Kicked - Monroe Social Club",
+                description=f"You have been kicked from Monroe Social Club.",
+                color=color
+            )
 
-            dm_embed.add_field(name="Reason", value=reason, inline=False)
-            dm_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
-            dm_embed.set_footer(text="Please follow server rules to avoid further action.")
+        dm_embed.add_field(name="Reason", value=reason, inline=False)
+        dm_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
+        dm_embed.set_footer(text="Please follow server rules to avoid further action.")
 
-            await self.target.send(embed=dm_embed)
-        except discord.Forbidden:
-            pass
+        # Queued so the interaction is answered first, closed DMs are recorded as failures
+        interaction.client.background_tasks.submit(
+            functools.partial(self.target.send, embed=dm_embed),
+            name=f"moderation DM to {self.target.id}"
+        )
 
         await interaction.response.send_message(f"✅ {self.target.mention} has been {self.action_type.lower()}ed for: {reason}", ephemeral=True)
 
@@ -184,6 +187,9 @@ class CustomReasonModal(discord.ui.Modal):
                 await interaction.response.send_message("❌ I don't have permission to kick this user.", ephemeral=True)
                 return
 
+        # Notify listeners such as the dashboard live feed
+        interaction.client.dispatch('moderation_action', self.action_type, self.target, str(self.staff_member), reason)
+
         # Create moderation embed for logs
         log_embed = create_moderation_embed(
             action=self.action_type,
@@ -197,68 +203,66 @@ class CustomReasonModal(discord.ui.Modal):
             log_embed.set_image(url=self.image.url)
 
         # Log to both moderation log channels
-        log_channels = [
-            interaction.client.get_channel(1353388676981456917),
-            interaction.client.get_channel(1387524238117830776)
-        ]
+        log_channels = [interaction.client.get_channel(channel_id) for channel_id in Config.MODERATION_LOG_CHANNELS]
 
         for log_channel in log_channels:
             if log_channel:
-                try:
-                    await log_channel.send(embed=log_embed)
-                except Exception as e:
-                    print(f"Failed to send log to channel {log_channel.id}: {e}")
+                interaction.client.background_tasks.submit(
+                    functools.partial(log_channel.send, embed=log_embed),
+                    name=f"moderation log to channel {log_channel.id}"
+                )
 
         # Send public announcement to the first channel for all actions
         announcement_channel = interaction.client.get_channel(1353388676981456917)
         if announcement_channel:
-            try:
-                # Create public announcement embed
-                announcement_embed = discord.Embed(
-                    title=f"📋 {self.action_type} Issued",
-                    description=f"{self.target.mention} has been {self.action_type.lower()}ed.",
-                    color=color
-                )
-                announcement_embed.add_field(name="Reason", value=reason, inline=False)
-                announcement_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
-                announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
-                announcement_embed.timestamp = discord.utils.utcnow()
+            # Create public announcement embed
+            announcement_embed = discord.Embed(
+                title=f"📋 {self.action_type} Issued",
+                description=f"{self.target.mention} has been {self.action_type.lower()}ed.",
+                color=color
+            )
+            announcement_embed.add_field(name="Reason", value=reason, inline=False)
+            announcement_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
+            announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
+            announcement_embed.timestamp = discord.utils.utcnow()
 
-                if self.image:
-                    announcement_embed.set_image(url=self.image.url)
+            if self.image:
+                announcement_embed.set_image(url=self.image.url)
 
-                await announcement_channel.send(embed=announcement_embed)
-            except Exception as e:
-                print(f"Failed to send announcement to channel {announcement_channel.id}: {e}")
+            interaction.client.background_tasks.submit(
+                functools.partial(announcement_channel.send, embed=announcement_embed),
+                name=f"moderation announcement to channel {announcement_channel.id}"
+            )
 
         # Send DM to user
-        try:
-            if self.action_type == "Warning":
-                dm_embed = discord.Embed(
-                    title="⚠️ Warning - Monroe Social Club",
-                    description=f"You have been warned in Monroe Social Club.",
-                    color=color
-                )
-            elif self.action_type == "Ban":
-                dm_embed = discord.Embed(
-                    title="🔨 Banned - Monroe Social Club",
-                    description=f"You have been banned from Monroe Social Club.",
-                    color=color
-                )
-            elif self.action_type == "Kick":
-                dm_embed = discord.Embed(
-                    title="👢 Kicked - Monroe Social Club",
-                    description=f"You have been kicked from Monroe Social Club.",
-                    color=color
-                )
+        if self.action_type == "Warning":
+            dm_embed = discord.Embed(
+                title="⚠️ Warning - Monroe Social Club",
+                description=f"You have been warned in Monroe Social Club.",
+                color=color
+            )
+        elif self.action_type == "Ban":
+            dm_embed = discord.Embed(
+                title="🔨 Banned - Monroe Social Club",
+                description=f"You have been banned from Monroe Social Club.",
+                color=color
+            )
+        elif self.action_type == "Kick":
+            dm_embed = discord.Embed(
+                title="👢 Kicked - Monroe Social Club",
+                description=f"You have been kicked from Monroe Social Club.",
+                color=color
+            )
 
-            dm_embed.add_field(name="Reason", value=reason, inline=False)
-            dm_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
-            dm_embed.set_footer(text="Please follow server rules to avoid further action.")
+        dm_embed.add_field(name="Reason", value=reason, inline=False)
+        dm_embed.add_field(name="Staff Member", value=self.staff_member.mention, inline=True)
+        dm_embed.set_footer(text="Please follow server rules to avoid further action.")
 
-            await self.target.send(embed=dm_embed)
-        except discord.Forbidden:
-            pass
+        # Queued so the interaction is answered first, closed DMs are recorded as failures
+        interaction.client.background_tasks.submit(
+            functools.partial(self.target.send, embed=dm_embed),
+            name=f"moderation DM to {self.target.id}"
+        )
 
         await interaction.response.send_message(f"✅ {self.target.mention} has been {self.action_type.lower()}ed for: {reason}", ephemeral=True)
 
@@ -479,6 +483,7 @@ class ModerationCog(commands.Cog):
 
             # Unban the user
             await interaction.guild.unban(banned_user, reason=f"Unbanned by {interaction.user} - {reason}")
+            self.bot.dispatch('moderation_action', "Unban", banned_user, str(interaction.user), reason)
 
             # Create unban embed
             embed = create_moderation_embed(
@@ -490,35 +495,32 @@ class ModerationCog(commands.Cog):
             )
 
             # Log to both moderation log channels
-            log_channels = [
-                self.bot.get_channel(1353388676981456917),
-                self.bot.get_channel(1387524238117830776)
-            ]
+            log_channels = [self.bot.get_channel(channel_id) for channel_id in Config.MODERATION_LOG_CHANNELS]
 
             for log_channel in log_channels:
                 if log_channel:
-                    try:
-                        await log_channel.send(embed=embed)
-                    except Exception as e:
-                        print(f"Failed to send log to channel {log_channel.id}: {e}")
+                    self.bot.background_tasks.submit(
+                        functools.partial(log_channel.send, embed=embed),
+                        name=f"moderation log to channel {log_channel.id}"
+                    )
 
             # Send public announcement
             announcement_channel = self.bot.get_channel(1353388676981456917)
             if announcement_channel:
-                try:
-                    announcement_embed = discord.Embed(
-                        title="📋 Unban Issued",
-                        description=f"{banned_user.mention} has been unbanned.",
-                        color=Config.COLORS["success"]
-                    )
-                    announcement_embed.add_field(name="Reason", value=reason, inline=False)
-                    announcement_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
-                    announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
-                    announcement_embed.timestamp = discord.utils.utcnow()
+                announcement_embed = discord.Embed(
+                    title="📋 Unban Issued",
+                    description=f"{banned_user.mention} has been unbanned.",
+                    color=Config.COLORS["success"]
+                )
+                announcement_embed.add_field(name="Reason", value=reason, inline=False)
+                announcement_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
+                announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
+                announcement_embed.timestamp = discord.utils.utcnow()
 
-                    await announcement_channel.send(embed=announcement_embed)
-                except Exception as e:
-                    print(f"Failed to send announcement to channel {announcement_channel.id}: {e}")
+                self.bot.background_tasks.submit(
+                    functools.partial(announcement_channel.send, embed=announcement_embed),
+                    name=f"moderation announcement to channel {announcement_channel.id}"
+                )
 
             await interaction.response.send_message(f"✅ {banned_user.mention} has been unbanned for: {reason}", ephemeral=True)
         except discord.NotFound:
@@ -536,6 +538,8 @@ class ModerationCog(commands.Cog):
             await interaction.response.send_message("❌ You don't have permission to use this command.", ephemeral=True)
             return
 
+        self.bot.dispatch('moderation_action', "Warning Removed", member, str(interaction.user), reason)
+
         # Create unwarn embed
         embed = create_moderation_embed(
             action="Warning Removed",
@@ -546,50 +550,48 @@ class ModerationCog(commands.Cog):
         )
 
         # Log to both moderation log channels
-        log_channels = [
-            interaction.client.get_channel(1353388676981456917),
-            interaction.client.get_channel(1387524238117830776)
-        ]
+        log_channels = [interaction.client.get_channel(channel_id) for channel_id in Config.MODERATION_LOG_CHANNELS]
 
         for log_channel in log_channels:
             if log_channel:
-                try:
-                    await log_channel.send(embed=embed)
-                except Exception as e:
-                    print(f"Failed to send log to channel {log_channel.id}: {e}")
+                self.bot.background_tasks.submit(
+                    functools.partial(log_channel.send, embed=embed),
+                    name=f"moderation log to channel {log_channel.id}"
+                )
 
         # Send public announcement
         announcement_channel = interaction.client.get_channel(1353388676981456917)
         if announcement_channel:
-            try:
-                announcement_embed = discord.Embed(
-                    title="📋 Warning Removed",
-                    description=f"A warning has been removed from {member.mention}.",
-                    color=Config.COLORS["success"]
-                )
-                announcement_embed.add_field(name="Reason", value=reason, inline=False)
-                announcement_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
-                announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
-                announcement_embed.timestamp = discord.utils.utcnow()
-
-                await announcement_channel.send(embed=announcement_embed)
-            except Exception as e:
-                print(f"Failed to send announcement to channel {announcement_channel.id}: {e}")
-
-        # Send DM to user
-        try:
-            dm_embed = discord.Embed(
-                title="✅ Warning Removed - Monroe Social Club",
-                description=f"A warning has been removed from your record in Monroe Social Club.",
+            announcement_embed = discord.Embed(
+                title="📋 Warning Removed",
+                description=f"A warning has been removed from {member.mention}.",
                 color=Config.COLORS["success"]
             )
-            dm_embed.add_field(name="Reason", value=reason, inline=False)
-            dm_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
-            dm_embed.set_footer(text="Keep up the good behavior!")
+            announcement_embed.add_field(name="Reason", value=reason, inline=False)
+            announcement_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
+            announcement_embed.set_footer(text="Monroe Social Club - Moderation System")
+            announcement_embed.timestamp = discord.utils.utcnow()
+
+            self.bot.background_tasks.submit(
+                functools.partial(announcement_channel.send, embed=announcement_embed),
+                name=f"moderation announcement to channel {announcement_channel.id}"
+            )
 
-            await member.send(embed=dm_embed)
-        except discord.Forbidden:
-            pass  # User has DMs disabled
+        # Send DM to user
+        dm_embed = discord.Embed(
+            title="✅ Warning Removed - Monroe Social Club",
+            description=f"A warning has been removed from your record in Monroe Social Club.",
+            color=Config.COLORS["success"]
+        )
+        dm_embed.add_field(name="Reason", value=reason, inline=False)
+        dm_embed.add_field(name="Staff Member", value=interaction.user.mention, inline=True)
+        dm_embed.set_footer(text="Keep up the good behavior!")
+
+        # Queued so the interaction is answered first, closed DMs are recorded as failures
+        self.bot.background_tasks.submit(
+            functools.partial(member.send, embed=dm_embed),
+            name=f"moderation DM to {member.id}"
+        )
 
         await interaction.response.send_message(f"✅ Warning removed from {member.mention} for: {reason}", ephemeral=True)
 
@@ -635,18 +637,11 @@ class ModerationCog(commands.Cog):
             embed.set_footer(text="Monroe Social Club - Moderation System", icon_url=interaction.user.avatar.url if interaction.user.avatar else interaction.user.default_avatar.url)
             embed.timestamp = discord.utils.utcnow()
 
-            # Log to both moderation log channels
-            log_channels = [
-                self.bot.get_channel(1353388676981456917),
-                self.bot.get_channel(1387524238117830776)
-            ]
-
-            for log_channel in log_channels:
-                if log_channel:
-                    try:
-                        await log_channel.send(embed=embed)
-                    except Exception as e:
-                        print(f"Failed to send log to channel {log_channel.id}: {e}")
+            # Log to both moderation log channels concurrently
+            results = await send_to_channels(self.bot, Config.MODERATION_LOG_CHANNELS, embed=embed)
+            for result in results:
+                if not result['success']:
+                    print(f"Failed to send log to {result['target']}: {result['error']}")
 
             await interaction.followup.send(f"✅ Cleared {len(deleted)} messages for: {reason}", ephemeral=True)
         except discord.Forbidden:
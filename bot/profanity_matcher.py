@@ -0,0 +1,85 @@
+import re
+from better_profanity import profanity
+from better_profanity.utils import get_complete_path_of_file, read_wordlist
+
+# Leetspeak substitutions baked into the compiled pattern. Starts from
+# better-profanity's own character map and adds the extra symbols the automod
+# has always accepted (e.g. "!" for "i", "0" for "o").
+LEETSPEAK_MAP = {
+    'a': 'a@4*',
+    'e': 'e3*',
+    'i': 'i1!l*',
+    'l': 'l1',
+    'o': 'o0@*',
+    's': 's5$',
+    't': 't7',
+    'u': 'uv*',
+    'v': 'vu*',
+}
+
+def _char_class(char):
+    """Return the regex fragment matching a single wordlist character"""
+    if char.isspace():
+        return r'\s+'
+    variants = set(LEETSPEAK_MAP.get(char, char)) | set(profanity.CHARS_MAPPING.get(char, ()))
+    variants.add(char)
+    if len(variants) == 1:
+        return re.escape(char)
+    return '[' + ''.join(re.escape(c) for c in sorted(variants)) + ']'
+
+class ProfanityMatcher:
+    """Single-pass profanity matcher compiled once from every wordlist.
+
+    All words are merged into a prefix trie and emitted as one regex, so the
+    engine only follows branches that still match at each position. Scanning
+    a message costs O(len(message)) and no longer grows with the wordlist.
+
+    With ``whole_words`` a word only matches on its own ("shit" but not
+    "xshitx" or "class" for "ass"); without it any substring matches, like
+    the old ``word in text`` loop.
+    """
+
+    def __init__(self, custom_words=None, include_default_wordlist=True, whole_words=True):
+        words = set()
+        if include_default_wordlist:
+            words.update(read_wordlist(get_complete_path_of_file("profanity_wordlist.txt")))
+        words.update(custom_words or [])
+
+        self.word_count = 0
+        trie = {}
+        for word in words:
+            word = ' '.join(word.lower().split())
+            if not word:
+                continue
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+            self.word_count += 1
+
+        body = self._trie_to_pattern(trie) or r'(?!)'
+        self.whole_words = whole_words
+        self.pattern = re.compile(r'(?<!\w)(?:' + body + r')(?!\w)' if whole_words else body)
+
+    def _trie_to_pattern(self, node):
+        """Convert a trie node into a regex fragment with shared prefixes"""
+        is_terminal = '' in node
+        branches = [
+            _char_class(char) + self._trie_to_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+
+        if not branches:
+            return ''
+
+        if len(branches) == 1 and not is_terminal:
+            return branches[0]
+
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if is_terminal else pattern
+
+    def search(self, text):
+        """Return the first profane word found in text, or None"""
+        match = self.pattern.search(text.lower())
+        return match.group(0) if match else None
@@ -0,0 +1,98 @@
+import re
+from collections import deque
+from bot.rate_tracker import monotonic_seconds
+
+NAME_SKELETON_PATTERN = re.compile(r'[^a-z]')
+
+def name_skeleton(name):
+    """Letters-only prefix of a username, so 'raider_123' and 'Raider44' compare equal"""
+    skeleton = NAME_SKELETON_PATTERN.sub('', name.lower())[:6]
+    return skeleton if len(skeleton) >= 3 else None
+
+def cluster_by_creation(members, max_gap):
+    """Group members whose accounts were created within max_gap seconds of the previous one"""
+    ordered = sorted(members, key=lambda member: member.created_at)
+    clusters = []
+    current = []
+    for member in ordered:
+        if current and (member.created_at - current[-1].created_at).total_seconds() > max_gap:
+            clusters.append(current)
+            current = []
+        current.append(member)
+    if current:
+        clusters.append(current)
+    return sorted((cluster for cluster in clusters if len(cluster) > 1), key=len, reverse=True)
+
+def cluster_by_name(members):
+    """Group members by name skeleton, returns ``[(skeleton, members)]`` largest first"""
+    groups = {}
+    for member in members:
+        skeleton = name_skeleton(member.name)
+        if skeleton:
+            groups.setdefault(skeleton, []).append(member)
+    return sorted(((skeleton, group) for skeleton, group in groups.items() if len(group) > 1), key=lambda item: len(item[1]), reverse=True)
+
+class RaidIncident:
+    """Joins collected while a guild is over the raid threshold"""
+
+    __slots__ = ('guild_id', 'started', 'last_join', 'members', 'reported_count', 'previous_verification', 'lockdown_error')
+
+    def __init__(self, guild_id, now, members):
+        self.guild_id = guild_id
+        self.started = now
+        self.last_join = now
+        self.members = list(members)
+        self.reported_count = 0
+        self.previous_verification = None  # set once the lockdown edit succeeded
+        self.lockdown_error = None  # why the last lockdown edit failed, if it did
+
+class RaidDetector:
+    """Guild-level join-rate detector.
+
+    Keeps a sliding window of recent joins per guild. Once ``threshold``
+    joins land inside ``window`` seconds an incident opens, seeded with the
+    joins in the window, and every later join is added to it until the guild
+    has been quiet for a full window. Recording a join is O(1), so bursts of
+    hundreds of joins per second only append to lists.
+    """
+
+    def __init__(self, threshold, window):
+        self.threshold = threshold
+        self.window = window
+        self.recent_joins = {}  # guild_id -> deque of (second, member)
+        self.incidents = {}     # guild_id -> RaidIncident
+
+    def record_join(self, member, now=None):
+        """Record a join, returns the incident when this join opens one"""
+        now = monotonic_seconds() if now is None else now
+        guild_id = member.guild.id
+
+        incident = self.incidents.get(guild_id)
+        if incident is not None:
+            incident.members.append(member)
+            incident.last_join = now
+            return None
+
+        joins = self.recent_joins.get(guild_id)
+        if joins is None:
+            joins = self.recent_joins[guild_id] = deque()
+        joins.append((now, member))
+        while now - joins[0][0] > self.window:
+            joins.popleft()
+
+        if len(joins) < self.threshold:
+            return None
+
+        incident = self.incidents[guild_id] = RaidIncident(guild_id, now, (joined for _, joined in joins))
+        del self.recent_joins[guild_id]
+        return incident
+
+    def in_raid(self, guild_id):
+        return guild_id in self.incidents
+
+    def is_over(self, incident, now=None):
+        now = monotonic_seconds() if now is None else now
+        return now - incident.last_join >= self.window
+
+    def close(self, incident):
+        self.incidents.pop(incident.guild_id, None)
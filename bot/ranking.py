@@ -0,0 +1,73 @@
+import heapq
+
+class TopK:
+    """Highest-scoring users for one leaderboard category.
+
+    Activity counters normally only grow, so a user outside the top ``size``
+    can only get in by beating the current floor and nobody falls back in
+    from below. That lets the ranking be kept up to date on every counter
+    change: a user outside the top costs a single comparison, one inside
+    costs O(size). If a tracked score ever drops below the floor, a user
+    outside the top may now deserve its place, so the ranking is flagged
+    ``stale`` and the owner rebuilds it from every score.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.scores = {}  # user_id -> score, only for users in the top
+        self.floor = 0    # lowest score in the top once it is full
+        self.stale = False
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __contains__(self, user_id):
+        return user_id in self.scores
+
+    def update(self, user_id, score):
+        """Record a user's new score"""
+        scores = self.scores
+        if user_id in scores:
+            previous = scores[user_id]
+            scores[user_id] = score
+            if len(scores) >= self.size:
+                if score < self.floor:
+                    # Users outside the top were never compared with this score
+                    self.stale = True
+                elif previous == self.floor:
+                    self.floor = min(scores.values())
+            return
+
+        if len(scores) < self.size:
+            scores[user_id] = score
+            if len(scores) == self.size:
+                self.floor = min(scores.values())
+        elif score > self.floor:
+            del scores[min(scores, key=scores.get)]
+            scores[user_id] = score
+            self.floor = min(scores.values())
+
+    def rebuild(self, items):
+        """Replace the top with the best of ``(user_id, score)`` pairs"""
+        best = heapq.nlargest(self.size, items, key=lambda item: item[1])
+        self.scores = dict(best)
+        self.floor = min(self.scores.values()) if len(self.scores) == self.size else 0
+        self.stale = False
+
+    def ranked(self):
+        """Return ``(user_id, score)`` pairs, best first"""
+        return sorted(self.scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def rank(self, user_id, eligible=None):
+        """1-based position, or None when the user is outside the top.
+
+        ``eligible(user_id)`` optionally filters who counts, e.g. members
+        still in the guild.
+        """
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        return 1 + sum(
+            1 for other_id, other in self.scores.items()
+            if other > score and (eligible is None or eligible(other_id))
+        )
@@ -0,0 +1,120 @@
+import time
+from collections import OrderedDict
+
+def monotonic_seconds():
+    return int(time.monotonic())
+
+class _Window:
+    __slots__ = ('last_bucket', 'total', 'counts')
+
+    def __init__(self, bucket, slots):
+        self.last_bucket = bucket
+        self.total = 0
+        self.counts = [0] * slots
+
+class RateTracker:
+    """Per-key event counts over a sliding window.
+
+    Each key has a fixed ring of bucket counters on monotonic integer
+    seconds, so recording an event and reading the count are O(1) (at most
+    one pass over the ring after a long gap). Keys are kept in order of last
+    activity and idle ones are evicted as new events arrive, so no periodic
+    cleanup is needed.
+    """
+
+    def __init__(self, window, buckets=12):
+        self.window = window
+        self.bucket_span = max(1, window // buckets)
+        self.slots = -(-window // self.bucket_span)
+        self.entries = OrderedDict()  # key -> _Window, least recently active first
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _advance(self, entry, bucket):
+        gap = bucket - entry.last_bucket
+        if gap >= self.slots:
+            entry.counts = [0] * self.slots
+            entry.total = 0
+        else:
+            for expired in range(entry.last_bucket + 1, bucket + 1):
+                slot = expired % self.slots
+                entry.total -= entry.counts[slot]
+                entry.counts[slot] = 0
+        entry.last_bucket = bucket
+
+    def _evict_idle(self, bucket):
+        entries = self.entries
+        while entries:
+            entry = next(iter(entries.values()))
+            if bucket - entry.last_bucket < self.slots:
+                break
+            entries.popitem(last=False)
+
+    def hit(self, key, now=None):
+        """Record an event for key and return the count within the window"""
+        bucket = (monotonic_seconds() if now is None else now) // self.bucket_span
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = _Window(bucket, self.slots)
+        else:
+            if bucket != entry.last_bucket:
+                self._advance(entry, bucket)
+            self.entries.move_to_end(key)
+
+        entry.counts[bucket % self.slots] += 1
+        entry.total += 1
+        self._evict_idle(bucket)
+        return entry.total
+
+    def count(self, key, now=None):
+        """Events for key within the window, without recording one"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return 0
+        bucket = (monotonic_seconds() if now is None else now) // self.bucket_span
+        if bucket != entry.last_bucket:
+            self._advance(entry, bucket)
+        return entry.total
+
+class DistinctTracker:
+    """Per-key distinct values (e.g. channel ids) seen within a sliding window.
+
+    Values are kept in order of last sighting so expiry only ever looks at
+    the oldest one, and idle keys are evicted the same way as in RateTracker.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.entries = OrderedDict()  # key -> OrderedDict(value -> last seen second)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, key, value, now=None):
+        """Record a value for key and return how many distinct values are in the window"""
+        now = monotonic_seconds() if now is None else now
+        values = self.entries.get(key)
+        if values is None:
+            values = self.entries[key] = OrderedDict()
+        else:
+            self.entries.move_to_end(key)
+
+        values[value] = now
+        values.move_to_end(value)
+        while now - next(iter(values.values())) > self.window:
+            values.popitem(last=False)
+
+        # Idle keys: their newest value has expired
+        while self.entries:
+            oldest_key, oldest_values = next(iter(self.entries.items()))
+            if oldest_key == key or now - next(reversed(oldest_values.values())) <= self.window:
+                break
+            self.entries.popitem(last=False)
+
+        return len(values)
+
+    def recent(self, key, limit):
+        """Most recently seen values for key, oldest first"""
+        values = self.entries.get(key)
+        return list(values)[-limit:] if values else []
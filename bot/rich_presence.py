@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands, tasks
 from bot.config import Config
-import aiohttp
 import asyncio
 
 class RichPresence(commands.Cog):
@@ -15,25 +14,24 @@ class RichPresence(commands.Cog):
     async def get_roblox_game_data(self):
         """Get current player count for the Roblox game"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # First get universe ID from place ID
-                place_url = f"https://apis.roblox.com/universes/v1/places/{Config.ROBLOX_MAP_ID}/universe"
-                async with session.get(place_url) as response:
-                    if response.status == 200:
-                        universe_data = await response.json()
-                        universe_id = universe_data.get('universeId')
+            # First get universe ID from place ID
+            place_url = f"https://apis.roblox.com/universes/v1/places/{Config.ROBLOX_MAP_ID}/universe"
+            async with self.bot.http_session.get(place_url) as response:
+                if response.status == 200:
+                    universe_data = await response.json()
+                    universe_id = universe_data.get('universeId')
                         
-                        if universe_id:
-                            # Get game data using universe ID
-                            game_url = f"https://games.roblox.com/v1/games?universeIds={universe_id}"
-                            async with session.get(game_url) as game_response:
-                                if game_response.status == 200:
-                                    game_data = await game_response.json()
-                                    if game_data.get('data') and len(game_data['data']) > 0:
-                                        game_info = game_data['data'][0]
-                                        playing = game_info.get('playing', 0)
-                                        visits = game_info.get('visits', 0)
-                                        return playing, visits
+                    if universe_id:
+                        # Get game data using universe ID
+                        game_url = f"https://games.roblox.com/v1/games?universeIds={universe_id}"
+                        async with self.bot.http_session.get(game_url) as game_response:
+                            if game_response.status == 200:
+                                game_data = await game_response.json()
+                                if game_data.get('data') and len(game_data['data']) > 0:
+                                    game_info = game_data['data'][0]
+                                    playing = game_info.get('playing', 0)
+                                    visits = game_info.get('visits', 0)
+                                    return playing, visits
         except Exception as e:
             print(f"Failed to fetch Roblox game data: {e}")
         
@@ -1,81 +1,109 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import aiohttp
 import asyncio
+import aiohttp
 from bot.config import Config
+from bot.cache import AsyncTTLCache
 
 class RobloxCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # One bounded cache per endpoint, TTLs from Config.ROBLOX_CACHE
+        self.caches = {
+            endpoint: AsyncTTLCache(
+                ttl=settings['ttl'],
+                negative_ttl=settings['negative_ttl'],
+                stale_ttl=settings['stale_ttl'],
+                maxsize=settings['maxsize']
+            )
+            for endpoint, settings in Config.ROBLOX_CACHE.items()
+        }
+
     async def get_rover_data(self, discord_id):
-        """Get Roblox data from Rover API"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Get Discord to Roblox mapping from Rover
-                async with session.get(f"{Config.ROVER_API_BASE}/guilds/{Config.ROBLOX_GROUP_ID}/discord-to-roblox/{discord_id}") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    return None
-        except Exception as e:
-            print(f"Error fetching Rover data: {e}")
-            return None
+        """Get Roblox data from Rover API (cached, unverified users are cached briefly)"""
+        return await self.caches['rover'].get_or_fetch(discord_id, lambda: self._fetch_rover_data(discord_id))
 
     async def get_roblox_user_info(self, roblox_id):
-        """Get Roblox user information"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Get user info from Roblox API
-                async with session.get(f"https://users.roblox.com/v1/users/{roblox_id}") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return None
-        except Exception as e:
-            print(f"Error fetching Roblox user info: {e}")
-            return None
+        """Get Roblox user information (cached)"""
+        return await self.caches['user_info'].get_or_fetch(roblox_id, lambda: self._fetch_roblox_user_info(roblox_id))
 
     async def get_roblox_avatar_headshot(self, roblox_id):
-        """Get Roblox user avatar headshot"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={roblox_id}&size=420x420&format=Png&isCircular=false") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("data") and len(data["data"]) > 0:
-                            return data["data"][0].get("imageUrl")
-                    return None
-        except Exception as e:
-            print(f"Error fetching Roblox avatar: {e}")
-            return None
+        """Get Roblox user avatar headshot (cached)"""
+        return await self.caches['headshot'].get_or_fetch(roblox_id, lambda: self._fetch_roblox_avatar_headshot(roblox_id))
 
     async def get_group_info(self, group_id):
-        """Get Roblox group information"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://groups.roblox.com/v1/groups/{group_id}") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return None
-        except Exception as e:
-            print(f"Error fetching group info: {e}")
-            return None
+        """Get Roblox group information (cached)"""
+        return await self.caches['group_info'].get_or_fetch(group_id, lambda: self._fetch_group_info(group_id))
 
     async def get_user_group_role(self, roblox_id, group_id):
+        """Get user's role in a specific group (cached)"""
+        return await self.caches['group_role'].get_or_fetch(
+            (roblox_id, group_id),
+            lambda: self._fetch_user_group_role(roblox_id, group_id)
+        )
+
+    async def _get_json(self, url):
+        """GET a Roblox/Rover endpoint, returns None on 404.
+
+        Timeouts, connection errors and any other non-200 status raise, so the
+        cache keeps its previous entry instead of storing the failure as "not
+        found".
+        """
+        async with self.bot.http_session.get(url) as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            return await response.json()
+
+    async def _fetch_rover_data(self, discord_id):
+        """Get Roblox data from Rover API"""
+        # Get Discord to Roblox mapping from Rover
+        return await self._get_json(f"{Config.ROVER_API_BASE}/guilds/{Config.ROBLOX_GROUP_ID}/discord-to-roblox/{discord_id}")
+
+    async def _fetch_roblox_user_info(self, roblox_id):
+        """Get Roblox user information"""
+        return await self._get_json(f"https://users.roblox.com/v1/users/{roblox_id}")
+
+    async def _fetch_roblox_avatar_headshot(self, roblox_id):
+        """Get Roblox user avatar headshot"""
+        data = await self._get_json(f"https://thumbnails.roblox.com/v1/users/avatar-headshot?userIds={roblox_id}&size=420x420&format=Png&isCircular=false")
+        if data and data.get("data"):
+            return data["data"][0].get("imageUrl")
+        return None
+
+    async def _fetch_group_info(self, group_id):
+        """Get Roblox group information"""
+        return await self._get_json(f"https://groups.roblox.com/v1/groups/{group_id}")
+
+    async def _fetch_user_group_role(self, roblox_id, group_id):
         """Get user's role in a specific group"""
+        data = await self._get_json(f"https://groups.roblox.com/v2/users/{roblox_id}/groups/roles")
+        for group in (data or {}).get("data", []):
+            if group.get("group", {}).get("id") == group_id:
+                return group.get("role", {})
+        return None
+
+    async def optional_lookup(self, coro):
+        """Await a non-essential lookup, returns (result, completed)"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://groups.roblox.com/v2/users/{roblox_id}/groups/roles") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        for group in data.get("data", []):
-                            if group.get("group", {}).get("id") == group_id:
-                                return group.get("role", {})
-                    return None
-        except Exception as e:
-            print(f"Error fetching user group role: {e}")
-            return None
+            return await asyncio.wait_for(coro, timeout=Config.ROBLOX_OPTIONAL_LOOKUP_TIMEOUT), True
+        except asyncio.TimeoutError:
+            return None, False
+        except aiohttp.ClientError as e:
+            print(f"Optional Roblox lookup failed: {e}")
+            return None, False
+
+    async def send_lookup_error(self, interaction, error):
+        """Tell the user Roblox could not be reached, nothing is cached for it"""
+        print(f"Error fetching Roblox data: {error}")
+        embed = discord.Embed(
+            title="❌ Roblox Unavailable",
+            description="Could not reach Roblox right now, please try again in a moment.",
+            color=Config.COLORS["error"]
+        )
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="verify", description="Link your Discord account with your Roblox account")
     async def verify(self, interaction: discord.Interaction):
@@ -118,7 +146,11 @@ class RobloxCog(commands.Cog):
         await interaction.response.defer()
         
         # Get Rover data
-        rover_data = await self.get_rover_data(target_user.id)
+        try:
+            rover_data = await self.get_rover_data(target_user.id)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            await self.send_lookup_error(interaction, e)
+            return
         if not rover_data:
             embed = discord.Embed(
                 title="❌ Account Not Verified",
@@ -143,8 +175,19 @@ class RobloxCog(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
 
-        # Get Roblox user info
-        roblox_info = await self.get_roblox_user_info(roblox_id)
+        # User info, avatar headshot and group role only depend on roblox_id,
+        # so fetch them concurrently. The headshot and group role are optional
+        # and time out on their own, so a slow endpoint only degrades its part.
+        try:
+            roblox_info, (avatar_url, _), (group_role, group_role_loaded) = await asyncio.gather(
+                self.get_roblox_user_info(roblox_id),
+                self.optional_lookup(self.get_roblox_avatar_headshot(roblox_id)),
+                self.optional_lookup(self.get_user_group_role(roblox_id, Config.ROBLOX_GROUP_ID))
+            )
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            await self.send_lookup_error(interaction, e)
+            return
+
         if not roblox_info:
             embed = discord.Embed(
                 title="❌ Roblox Profile Not Found",
@@ -154,12 +197,6 @@ class RobloxCog(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
 
-        # Get avatar headshot
-        avatar_url = await self.get_roblox_avatar_headshot(roblox_id)
-        
-        # Get group role
-        group_role = await self.get_user_group_role(roblox_id, Config.ROBLOX_GROUP_ID)
-        
         # Create profile embed
         embed = discord.Embed(
             title=f"🎮 Roblox Profile - {roblox_info['displayName']}",
@@ -200,6 +237,12 @@ class RobloxCog(commands.Cog):
                 value=f"**{group_role.get('name', 'Member')}**\nRank: {group_role.get('rank', 0)}",
                 inline=True
             )
+        elif not group_role_loaded:
+            embed.add_field(
+                name="🏖️ Monroe Social Club",
+                value="Role unavailable right now",
+                inline=True
+            )
         else:
             embed.add_field(
                 name="🏖️ Monroe Social Club",
@@ -227,7 +270,11 @@ class RobloxCog(commands.Cog):
     async def group_info(self, interaction: discord.Interaction):
         await interaction.response.defer()
         
-        group_info = await self.get_group_info(Config.ROBLOX_GROUP_ID)
+        try:
+            group_info = await self.get_group_info(Config.ROBLOX_GROUP_ID)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            await self.send_lookup_error(interaction, e)
+            return
         if not group_info:
             embed = discord.Embed(
                 title="❌ Group Not Found",
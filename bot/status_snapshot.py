@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import json
+import math
+import time
+from datetime import datetime
+from bot.config import Config
+
+# Gateway events that change what the status page shows
+STATUS_EVENTS = ('on_ready', 'on_resumed', 'on_guild_join', 'on_guild_remove', 'on_member_join', 'on_member_remove')
+
+def step(value, size):
+    """Round a gauge down to a multiple of ``size``"""
+    return int(value // size * size)
+
+class StatusSnapshot:
+    """Pre-rendered /api/status body.
+
+    The status is re-read on a short timer, and on the next request after a
+    gateway event that changes the counts. Events only set a flag, so a
+    burst of joins costs one re-read. The JSON body and its ETag are only
+    rebuilt when a field actually changed, so polls in between are served
+    from the cached bytes (or a 304 when the ETag matches). The timer also
+    measures event-loop lag as the overshoot of its own sleep.
+
+    Latency and loop lag jitter on every sample, so they are reported in
+    steps (``STATUS_LATENCY_STEP_MS``, ``STATUS_LOOP_LAG_STEP_MS``) and only
+    count as a change when they cross one. ``lastSeen`` is the time of the
+    last rebuild and never triggers one by itself; ``uptime`` changes every
+    minute, which bounds how old it gets.
+
+    Fields that changed since the previous rebuild are published to the
+    dashboard live feed as a ``status`` event.
+    """
+
+    def __init__(self, bot, interval=None):
+        self.bot = bot
+        self.interval = interval or Config.STATUS_REFRESH_INTERVAL
+        self.dirty = True
+        self.loop_lag = 0.0  # seconds, from the last timer tick
+        self.status = {}
+        self.body = b''
+        self.etag = None
+        self.task = None
+
+    def start(self):
+        """Rebuild on gateway events and start the refresh timer"""
+        for event in STATUS_EVENTS:
+            self.bot.add_listener(self.invalidate, event)
+        if self.task is None:
+            self.task = asyncio.create_task(self._refresh_loop())
+
+    def stop(self):
+        for event in STATUS_EVENTS:
+            self.bot.remove_listener(self.invalidate, event)
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def invalidate(self, *args):
+        self.dirty = True
+
+    async def _refresh_loop(self):
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.loop_lag = max(0.0, time.monotonic() - started - self.interval)
+            self.refresh()
+
+    def current(self):
+        """Return ``(body, etag)``, rebuilding first if an event changed the counts"""
+        if self.dirty or self.etag is None:
+            self.refresh()
+        return self.body, self.etag
+
+    def queue_depths(self):
+        depths = {}
+        for name, attribute in (('logs', 'log_dispatcher'), ('background', 'background_tasks'), ('jobs', 'jobs')):
+            component = getattr(self.bot, attribute, None)
+            depths[name] = component.stats()['queue_depth'] if component else 0
+        return depths
+
+    def refresh(self):
+        bot = self.bot
+        self.dirty = False
+        try:
+            uptime_seconds = (datetime.utcnow() - bot.start_time).total_seconds() if hasattr(bot, 'start_time') else 0
+            latency = bot.latency
+            status = {
+                "online": True,
+                "serverCount": len(bot.guilds),
+                "userCount": sum(g.member_count or 0 for g in bot.guilds),
+                "uptime": f"{int(uptime_seconds // 3600)}h {int((uptime_seconds % 3600) // 60)}m",
+                "lastSeen": datetime.utcnow().isoformat(),
+                "latencyMs": step(latency * 1000, Config.STATUS_LATENCY_STEP_MS) if math.isfinite(latency) else None,
+                "loopLagMs": step(self.loop_lag * 1000, Config.STATUS_LOOP_LAG_STEP_MS),
+                "queues": self.queue_depths()
+            }
+        except Exception as e:
+            print(f"❌ Failed to build status snapshot: {e}")
+            status = {
+                "online": False,
+                "serverCount": 0,
+                "userCount": 0,
+                "uptime": "Error",
+                "lastSeen": datetime.utcnow().isoformat()
+            }
+
+        changed = {key: value for key, value in status.items() if key != 'lastSeen' and self.status.get(key) != value}
+        if not changed and self.etag is not None:
+            return
+
+        live_feed = getattr(bot, 'live_feed', None)
+        if live_feed:
+            live_feed.publish('status', changed)
+
+        self.status = status
+        self.body = json.dumps(status).encode('utf-8')
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=8).hexdigest() + '"'
+
+    def matches(self, if_none_match):
+        """Whether an If-None-Match header matches the current ETag"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or self.etag in tags or f'W/{self.etag}' in tags
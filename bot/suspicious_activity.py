@@ -1,23 +1,30 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import asyncio
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
 import re
 from bot.config import Config
 from bot.embeds import create_moderation_embed
+from bot.rate_tracker import RateTracker, DistinctTracker, monotonic_seconds
+from bot.alert_throttle import AlertThrottle, escalate_severity
+from bot.raid_detection import RaidDetector, cluster_by_creation, cluster_by_name
+
+SUSPICIOUS_NAME_PATTERNS = [
+    re.compile(r'[0-9]{4,}'),  # Many numbers
+    re.compile(r'^[a-z]+[0-9]{4,}$'),  # Word followed by many numbers
+    re.compile(r'discord|admin|mod|staff|owner|bot'),  # Staff impersonation
+]
 
 class SuspiciousActivityCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-        # Tracking dictionaries
-        self.message_frequency = defaultdict(deque)  # User ID -> timestamps
-        self.channel_hopping = defaultdict(deque)    # User ID -> channel IDs
-        self.failed_commands = defaultdict(int)      # User ID -> failed attempts
-        self.reaction_spam = defaultdict(deque)      # User ID -> reaction timestamps
-        self.suspicious_patterns = defaultdict(int) # User ID -> pattern count
-        self.voice_hopping = defaultdict(deque)      # User ID -> voice channel switches
+        # Sliding-window trackers, idle users are evicted as events arrive
+        self.message_frequency = RateTracker(60)                  # User ID -> messages in 1 minute
+        self.channel_hopping = DistinctTracker(120)               # User ID -> channels in 2 minutes
+        self.failed_commands = RateTracker(3600, buckets=60)      # User ID -> failures in 1 hour
+        self.reaction_spam = RateTracker(60)                      # User ID -> reactions in 1 minute
+        self.voice_hopping = RateTracker(300)                     # User ID -> voice switches in 5 minutes
+        self.voice_hop_channels = DistinctTracker(300)            # User ID -> recent voice channels
 
         # Suspicious activity thresholds
         self.SPAM_THRESHOLD = 8  # messages per minute
@@ -26,59 +33,65 @@ class SuspiciousActivityCog(commands.Cog):
         self.REACTION_SPAM_THRESHOLD = 15  # reactions per minute
         self.VOICE_HOP_THRESHOLD = 4  # voice channels in 5 minutes
 
-        # Suspicious patterns
-        self.suspicious_keywords = [
-            'raid', 'nuke', 'destroy server', 'delete everything', 'crash bot',
-            'mass ban', 'exploit', 'hack', 'ddos', 'doxx', 'token grab',
-            'server crash', 'mass kick', 'admin panel', 'backdoor'
-        ]
+        # One alert state per (user, alert type): repeats inside the cooldown are
+        # counted and rolled into the next alert, bursts escalate the severity
+        self.alerts = AlertThrottle(
+            cooldown=Config.SUSPICIOUS_ALERT_COOLDOWN,
+            escalate_after=Config.SUSPICIOUS_ALERT_ESCALATE_AFTER,
+            max_cooldown=Config.SUSPICIOUS_ALERT_MAX_COOLDOWN
+        )
+        self.flush_alert_rollups.start()
 
-        # Cleanup task
-        self.cleanup_task = asyncio.create_task(self.cleanup_old_data())
+        # Guild-level join rate, joins during a raid are reported together
+        self.raids = RaidDetector(Config.RAID_DETECTION_THRESHOLD, Config.RAID_DETECTION_TIME_WINDOW)
+        self.raid_tasks = set()
 
     def cog_unload(self):
-        self.cleanup_task.cancel()
-
-    async def cleanup_old_data(self):
-        """Clean up old tracking data every 10 minutes"""
-        while True:
-            try:
-                await asyncio.sleep(600)  # 10 minutes
-                current_time = datetime.utcnow()
-
-                # Clean message frequency data (older than 5 minutes)
-                for user_id in list(self.message_frequency.keys()):
-                    self.message_frequency[user_id] = deque([
-                        timestamp for timestamp in self.message_frequency[user_id]
-                        if current_time - timestamp < timedelta(minutes=5)
-                    ])
-                    if not self.message_frequency[user_id]:
-                        del self.message_frequency[user_id]
-
-                # Clean channel hopping data (older than 10 minutes)
-                for user_id in list(self.channel_hopping.keys()):
-                    self.channel_hopping[user_id] = deque([
-                        (timestamp, channel_id) for timestamp, channel_id in self.channel_hopping[user_id]
-                        if current_time - timestamp < timedelta(minutes=10)
-                    ])
-                    if not self.channel_hopping[user_id]:
-                        del self.channel_hopping[user_id]
-
-                # Reset failed commands counter every hour
-                if current_time.minute == 0:
-                    self.failed_commands.clear()
-
-                print("🧹 Cleaned up suspicious activity tracking data")
-
-            except Exception as e:
-                print(f"❌ Error in cleanup task: {e}")
-
-    async def log_suspicious_activity(self, user, activity_type, description, severity="medium", additional_info=None):
-        """Log suspicious activity to the admin logs channel"""
-        log_channel = self.bot.get_channel(Config.ADMIN_LOG_CHANNEL)
-        if not log_channel:
+        self.flush_alert_rollups.cancel()
+        for task in self.raid_tasks:
+            task.cancel()
+
+    async def raise_alert(self, user, activity_type, description, severity="medium", additional_info=None):
+        """Log an alert unless the same alert for this user is cooling down"""
+        alert = self.alerts.observe((user.id, activity_type), (user, description, severity, additional_info))
+        if alert is None:
             return
 
+        await self.log_suspicious_activity(
+            user,
+            activity_type,
+            description,
+            severity=escalate_severity(severity, alert['level']),
+            additional_info=self.describe_rollup(additional_info, alert)
+        )
+
+    def describe_rollup(self, additional_info, alert):
+        lines = [additional_info] if additional_info else []
+        if alert['suppressed']:
+            lines.append(f"**Suppressed:** {alert['suppressed']} more events since the last alert")
+        if alert['escalated']:
+            lines.append(f"**Escalated:** level {alert['level']} after {Config.SUSPICIOUS_ALERT_ESCALATE_AFTER} repeats within the cooldown")
+        return "\n".join(lines) or None
+
+    @tasks.loop(seconds=60)
+    async def flush_alert_rollups(self):
+        """Report events still suppressed when an alert's cooldown runs out"""
+        for (user_id, activity_type), payload, alert in self.alerts.drain():
+            user, description, severity, additional_info = payload
+            await self.log_suspicious_activity(
+                user,
+                activity_type,
+                f"{description} (rollup)",
+                severity=escalate_severity(severity, alert['level']),
+                additional_info=self.describe_rollup(additional_info, alert)
+            )
+
+    @flush_alert_rollups.before_loop
+    async def before_flush_alert_rollups(self):
+        await self.bot.wait_until_ready()
+
+    async def log_suspicious_activity(self, user, activity_type, description, severity="medium", additional_info=None):
+        """Queue a suspicious activity log for the admin logs channel"""
         # Severity colors
         severity_colors = {
             "low": 0xFFFF00,      # Yellow
@@ -135,51 +148,35 @@ class SuspiciousActivityCog(commands.Cog):
         embed.set_thumbnail(url=user.avatar.url if user.avatar else user.default_avatar.url)
         embed.set_footer(text="Monroe Social Club - Suspicious Activity Monitor", icon_url=self.bot.user.avatar.url)
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send suspicious activity log: {e}")
+        self.bot.log_dispatcher.send_nowait(Config.ADMIN_LOG_CHANNEL, embed, severity=severity)
+        self.bot.dispatch('suspicious_alert', user, activity_type, description, severity)
 
     @commands.Cog.listener()
-    async def on_message(self, message):
+    async def on_message_features(self, message, features):
         """Monitor messages for suspicious activity"""
-        if message.author.bot or not message.guild:
-            return
-
         user_id = message.author.id
-        current_time = datetime.utcnow()
+        now = monotonic_seconds()
 
         # Track message frequency (spam detection)
-        self.message_frequency[user_id].append(current_time)
-
-        # Remove messages older than 1 minute
-        while (self.message_frequency[user_id] and 
-               current_time - self.message_frequency[user_id][0] > timedelta(minutes=1)):
-            self.message_frequency[user_id].popleft()
+        message_count = self.message_frequency.hit(user_id, now)
 
         # Check for spam
-        if len(self.message_frequency[user_id]) >= self.SPAM_THRESHOLD:
-            await self.log_suspicious_activity(
+        if message_count >= self.SPAM_THRESHOLD:
+            await self.raise_alert(
                 message.author,
                 "Message Spam",
-                f"Sent {len(self.message_frequency[user_id])} messages in 1 minute",
+                f"Sent {message_count} messages in 1 minute",
                 severity="high",
                 additional_info=f"**Channel:** {message.channel.mention}\n**Threshold:** {self.SPAM_THRESHOLD} messages/minute"
             )
 
         # Track channel hopping
-        self.channel_hopping[user_id].append((current_time, message.channel.id))
-
-        # Remove entries older than 2 minutes
-        while (self.channel_hopping[user_id] and 
-               current_time - self.channel_hopping[user_id][0][0] > timedelta(minutes=2)):
-            self.channel_hopping[user_id].popleft()
+        unique_channels = self.channel_hopping.add(user_id, message.channel.id, now)
 
         # Check for channel hopping
-        unique_channels = len(set(channel_id for _, channel_id in self.channel_hopping[user_id]))
         if unique_channels >= self.CHANNEL_HOP_THRESHOLD:
-            channels_list = [f"<#{channel_id}>" for _, channel_id in list(self.channel_hopping[user_id])[-5:]]
-            await self.log_suspicious_activity(
+            channels_list = [f"<#{channel_id}>" for channel_id in self.channel_hopping.recent(user_id, 5)]
+            await self.raise_alert(
                 message.author,
                 "Channel Hopping",
                 f"Posted in {unique_channels} different channels within 2 minutes",
@@ -187,12 +184,10 @@ class SuspiciousActivityCog(commands.Cog):
                 additional_info=f"**Recent Channels:** {', '.join(channels_list)}\n**Threshold:** {self.CHANNEL_HOP_THRESHOLD} channels"
             )
 
-        # Check for suspicious keywords
-        message_lower = message.content.lower()
-        found_keywords = [keyword for keyword in self.suspicious_keywords if keyword in message_lower]
+        # Check for suspicious keywords (matched in the shared classifier scan)
+        found_keywords = features.scan.keywords
         if found_keywords:
-            self.suspicious_patterns[user_id] += len(found_keywords)
-            await self.log_suspicious_activity(
+            await self.raise_alert(
                 message.author,
                 "Suspicious Keywords",
                 f"Used potentially harmful keywords in message",
@@ -201,8 +196,8 @@ class SuspiciousActivityCog(commands.Cog):
             )
 
         # Check for excessive mentions
-        if len(message.mentions) >= 5:
-            await self.log_suspicious_activity(
+        if features.mention_count >= 5:
+            await self.raise_alert(
                 message.author,
                 "Mass Mentions",
                 f"Mentioned {len(message.mentions)} users in a single message",
@@ -211,9 +206,8 @@ class SuspiciousActivityCog(commands.Cog):
             )
 
         # Check for invite links (unless in designated channels)
-        invite_pattern = r'(discord\.gg/|discordapp\.com/invite/|discord\.com/invite/)'
-        if re.search(invite_pattern, message.content, re.IGNORECASE):
-            await self.log_suspicious_activity(
+        if features.invite_links:
+            await self.raise_alert(
                 message.author,
                 "Invite Link Posted",
                 "Posted Discord invite link",
@@ -221,29 +215,31 @@ class SuspiciousActivityCog(commands.Cog):
                 additional_info=f"**Channel:** {message.channel.mention}\n**Message:** `{message.content[:200]}{'...' if len(message.content) > 200 else ''}`"
             )
 
+        # Check for links to denied domains (IP loggers and the like)
+        if features.scan.denied:
+            await self.raise_alert(
+                message.author,
+                "Blocked Link Posted",
+                "Posted a link to a denied domain",
+                severity="high",
+                additional_info=f"**Domains:** {', '.join(sorted(set(features.scan.denied)))}\n**Channel:** {message.channel.mention}"
+            )
+
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction, user):
         """Monitor reaction spam"""
         if user.bot:
             return
 
-        user_id = user.id
-        current_time = datetime.utcnow()
-
         # Track reaction frequency
-        self.reaction_spam[user_id].append(current_time)
-
-        # Remove reactions older than 1 minute
-        while (self.reaction_spam[user_id] and 
-               current_time - self.reaction_spam[user_id][0] > timedelta(minutes=1)):
-            self.reaction_spam[user_id].popleft()
+        reaction_count = self.reaction_spam.hit(user.id)
 
         # Check for reaction spam
-        if len(self.reaction_spam[user_id]) >= self.REACTION_SPAM_THRESHOLD:
-            await self.log_suspicious_activity(
+        if reaction_count >= self.REACTION_SPAM_THRESHOLD:
+            await self.raise_alert(
                 user,
                 "Reaction Spam",
-                f"Added {len(self.reaction_spam[user_id])} reactions in 1 minute",
+                f"Added {reaction_count} reactions in 1 minute",
                 severity="medium",
                 additional_info=f"**Threshold:** {self.REACTION_SPAM_THRESHOLD} reactions/minute\n**Channel:** {reaction.message.channel.mention}"
             )
@@ -255,36 +251,43 @@ class SuspiciousActivityCog(commands.Cog):
             return
 
         user_id = member.id
-        current_time = datetime.utcnow()
 
         # Only track if user switched channels (not just joined/left)
         if before.channel and after.channel and before.channel != after.channel:
-            self.voice_hopping[user_id].append((current_time, after.channel.id))
-
-            # Remove entries older than 5 minutes
-            while (self.voice_hopping[user_id] and 
-                   current_time - self.voice_hopping[user_id][0][0] > timedelta(minutes=5)):
-                self.voice_hopping[user_id].popleft()
+            now = monotonic_seconds()
+            switch_count = self.voice_hopping.hit(user_id, now)
+            self.voice_hop_channels.add(user_id, after.channel.id, now)
 
             # Check for voice hopping
-            if len(self.voice_hopping[user_id]) >= self.VOICE_HOP_THRESHOLD:
-                channels_list = [f"<#{channel_id}>" for _, channel_id in list(self.voice_hopping[user_id])[-3:]]
-                await self.log_suspicious_activity(
+            if switch_count >= self.VOICE_HOP_THRESHOLD:
+                channels_list = [f"<#{channel_id}>" for channel_id in self.voice_hop_channels.recent(user_id, 3)]
+                await self.raise_alert(
                     member,
                     "Voice Channel Hopping",
-                    f"Switched between {len(self.voice_hopping[user_id])} voice channels in 5 minutes",
+                    f"Switched between {switch_count} voice channels in 5 minutes",
                     severity="low",
                     additional_info=f"**Recent Channels:** {', '.join(channels_list)}\n**Threshold:** {self.VOICE_HOP_THRESHOLD} switches"
                 )
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        """Monitor for suspicious new accounts"""
+        """Monitor for raids and suspicious new accounts"""
+        incident = self.raids.record_join(member)
+        if incident is not None:
+            task = asyncio.create_task(self.watch_raid(member.guild, incident))
+            self.raid_tasks.add(task)
+            task.add_done_callback(self.raid_tasks.discard)
+            return
+
+        # Joiners during a raid are listed in the raid alert instead
+        if self.raids.in_raid(member.guild.id):
+            return
+
         account_age = (discord.utils.utcnow() - member.created_at).days
 
         # Flag very new accounts
         if account_age < 1:
-            await self.log_suspicious_activity(
+            await self.raise_alert(
                 member,
                 "New Account Joined",
                 f"Account created {account_age} day(s) ago",
@@ -293,34 +296,159 @@ class SuspiciousActivityCog(commands.Cog):
             )
 
         # Flag accounts with suspicious usernames
-        suspicious_name_patterns = [
-            r'[0-9]{4,}',  # Many numbers
-            r'^[a-z]+[0-9]{4,}$',  # Word followed by many numbers
-            r'discord|admin|mod|staff|owner|bot',  # Staff impersonation
-        ]
-
-        for pattern in suspicious_name_patterns:
-            if re.search(pattern, member.name.lower()):
-                await self.log_suspicious_activity(
+        name = member.name.lower()
+        for pattern in SUSPICIOUS_NAME_PATTERNS:
+            if pattern.search(name):
+                await self.raise_alert(
                     member,
                     "Suspicious Username",
-                    f"Username matches suspicious pattern: {pattern}",
+                    f"Username matches suspicious pattern: {pattern.pattern}",
                     severity="low",
                     additional_info=f"**Username:** {member.name}\n**Account Age:** {account_age} days"
                 )
                 break
 
+    async def watch_raid(self, guild, incident):
+        """Report a raid once the first burst settles, then again when the joins stop"""
+        try:
+            if Config.RAID_LOCKDOWN_ENABLED:
+                await self.set_lockdown(guild, incident, True)
+
+            await asyncio.sleep(Config.RAID_ALERT_DELAY)
+            self.report_raid(guild, incident, ended=False)
+
+            while not self.raids.is_over(incident):
+                await asyncio.sleep(max(1, incident.last_join + self.raids.window - monotonic_seconds()))
+        finally:
+            self.raids.close(incident)
+            if incident.previous_verification is not None:
+                await self.set_lockdown(guild, incident, False)
+
+        self.report_raid(guild, incident, ended=True)
+
+    async def set_lockdown(self, guild, incident, enabled):
+        """Raise the guild's verification level for the raid, or restore it afterwards.
+
+        The previous level is only recorded once the edit went through, so the
+        raid report and the restore never act on a lockdown that did not happen.
+        Failures are kept on the incident for the report.
+        """
+        if enabled:
+            if guild.verification_level >= Config.RAID_LOCKDOWN_VERIFICATION_LEVEL:
+                return
+            previous = guild.verification_level
+            level = Config.RAID_LOCKDOWN_VERIFICATION_LEVEL
+        else:
+            level = incident.previous_verification
+
+        try:
+            await guild.edit(verification_level=level, reason="Raid lockdown" if enabled else "Raid ended")
+        except discord.HTTPException as e:
+            incident.lockdown_error = str(e) or type(e).__name__
+            print(f"❌ Failed to {'enable' if enabled else 'lift'} raid lockdown for {guild.name}: {e}")
+            return
+
+        incident.lockdown_error = None
+        if enabled:
+            incident.previous_verification = previous
+        print(f"🔒 Raid lockdown {'enabled' if enabled else 'lifted'} for {guild.name}")
+
+    def report_raid(self, guild, incident, ended):
+        """Queue one consolidated alert for every member in the incident"""
+        members = incident.members
+        new_members = members[incident.reported_count:]
+        incident.reported_count = len(members)
+        duration = max(1, incident.last_join - incident.started + self.raids.window)
+
+        embed = discord.Embed(
+            title="✅ Raid Ended" if ended else "🚨 Raid Detected",
+            description=(
+                f"**{len(members)}** members joined **{guild.name}** within about {duration} seconds\n"
+                f"**Threshold:** {self.raids.threshold} joins in {self.raids.window} seconds"
+            ),
+            color=0x00FF00 if ended else 0x8B0000,
+            timestamp=discord.utils.utcnow()
+        )
+
+        creation_clusters = cluster_by_creation(members, Config.RAID_CLUSTER_CREATION_GAP)
+        if creation_clusters:
+            embed.add_field(
+                name="🕒 Account Creation Clusters",
+                value="\n".join(
+                    f"**{len(cluster)}** accounts created <t:{int(cluster[0].created_at.timestamp())}:f> - <t:{int(cluster[-1].created_at.timestamp())}:t>"
+                    for cluster in creation_clusters[:5]
+                ),
+                inline=False
+            )
+
+        name_clusters = cluster_by_name(members)
+        if name_clusters:
+            embed.add_field(
+                name="🔤 Similar Names",
+                value="\n".join(f"`{skeleton}*` × **{len(cluster)}**" for skeleton, cluster in name_clusters[:5]),
+                inline=False
+            )
+
+        if new_members:
+            # Clustered members first, they are the most likely raiders
+            clustered = {member.id for cluster in creation_clusters[:1] for member in cluster}
+            clustered.update(member.id for _, cluster in name_clusters[:1] for member in cluster)
+            ordered = sorted(new_members, key=lambda member: member.id not in clustered)
+            embed.add_field(
+                name="👥 Members Since Last Alert" if ended and len(new_members) < len(members) else "👥 Members",
+                value=self.format_member_list(ordered),
+                inline=False
+            )
+
+        lockdown = self.describe_lockdown(incident, ended)
+        if lockdown:
+            embed.add_field(name="🔒 Lockdown", value=lockdown, inline=False)
+
+        # Never low severity: the log queue sheds low entries exactly when a raid floods it
+        severity = "high" if ended else "critical"
+        embed.set_footer(text="Monroe Social Club - Suspicious Activity Monitor")
+        self.bot.log_dispatcher.send_nowait(Config.ADMIN_LOG_CHANNEL, embed, severity=severity)
+        self.bot.dispatch(
+            'suspicious_alert', None, "Raid Ended" if ended else "Raid Detected",
+            f"{len(members)} members joined {guild.name}", severity
+        )
+        print(f"🚨 Raid {'ended' if ended else 'detected'} in {guild.name}: {len(members)} joins")
+
+    def describe_lockdown(self, incident, ended):
+        """Lockdown line for a raid report, None when no lockdown was attempted"""
+        previous = incident.previous_verification
+        error = incident.lockdown_error
+        if previous is None:
+            return f"Could not raise the verification level: {error}" if error else None
+        if not ended:
+            return f"Verification level raised to **{Config.RAID_LOCKDOWN_VERIFICATION_LEVEL}**"
+        if error:
+            return f"Could not restore the verification level to **{previous}**, please restore it manually: {error}"
+        return f"Verification level restored to **{previous}**"
+
+    def format_member_list(self, members, limit=1000):
+        """Mentions and IDs, cut to fit one embed field"""
+        lines = []
+        length = 0
+        for index, member in enumerate(members):
+            line = f"{member.mention} `{member.id}`"
+            if length + len(line) + 1 > limit - 20:
+                lines.append(f"...and {len(members) - index} more")
+                break
+            lines.append(line)
+            length += len(line) + 1
+        return "\n".join(lines)
+
     @commands.Cog.listener()
     async def on_app_command_error(self, interaction, error):
         """Track failed command attempts"""
-        user_id = interaction.user.id
-        self.failed_commands[user_id] += 1
+        failure_count = self.failed_commands.hit(interaction.user.id)
 
-        if self.failed_commands[user_id] >= self.FAILED_COMMAND_THRESHOLD:
-            await self.log_suspicious_activity(
+        if failure_count >= self.FAILED_COMMAND_THRESHOLD:
+            await self.raise_alert(
                 interaction.user,
                 "Excessive Failed Commands",
-                f"Failed {self.failed_commands[user_id]} commands in the past hour",
+                f"Failed {failure_count} commands in the past hour",
                 severity="medium",
                 additional_info=f"**Latest Error:** {type(error).__name__}\n**Command:** /{interaction.command.name if hasattr(interaction, 'command') and interaction.command else 'Unknown'}\n**Threshold:** {self.FAILED_COMMAND_THRESHOLD} failures/hour"
             )
@@ -8,13 +8,34 @@ from aiohttp_jinja2 import setup as jinja2_setup, template
 import aiohttp_jinja2
 import jinja2
 import asyncio
+import signal
 from bot.credentials import credentials_manager
+from bot.log_dispatcher import LogDispatcher
+from bot.background_tasks import BackgroundTaskQueue
+from bot.broadcast import BroadcastManager
+from bot.job_queue import JobQueue
+from bot.status_snapshot import StatusSnapshot
+from bot.live_feed import LiveFeed
+from bot.delivery import fan_out, count_delivered
+from bot.http_client import create_http_session
+import functools
 
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+class MonroeBot(commands.Bot):
+    async def close(self):
+        # Flush queued jobs, log embeds and side-effect sends while discord.py's
+        # HTTP session is still open, super().close() shuts it down
+        if not self.is_closed():
+            for name in ('jobs', 'log_dispatcher', 'background_tasks'):
+                component = getattr(self, name, None)
+                if component is not None:
+                    await component.close()
+        await super().close()
+
+bot = MonroeBot(command_prefix='!', intents=intents)
 
 API_SECRET = os.getenv('API_SECRET', 'default-secret')
 
@@ -25,6 +46,7 @@ BROADCAST_CHANNELS = [1353393437650718910, 1353395315197218847]
 # Load all cogs
 async def load_cogs():
     cogs = [
+        'bot.message_analysis',
         'bot.automod',
         'bot.admin_logging',
         'bot.moderation',
@@ -35,7 +57,8 @@ async def load_cogs():
         'bot.activity_leaderboard',
         'bot.applications',
         'bot.welcome',
-        'bot.keep_alive'
+        'bot.keep_alive',
+        'bot.live_feed'
     ]
 
     for cog in cogs:
@@ -66,6 +89,24 @@ async def load_cogs():
 # Load cogs immediately when bot starts
 async def setup_bot():
     """Setup function to load cogs before starting bot"""
+    # Pooled HTTP session shared by every cog that calls external APIs
+    bot.http_session = create_http_session()
+
+    # Shared log delivery queue used by the logging cogs
+    bot.log_dispatcher = LogDispatcher(bot)
+
+    # Supervised queue for fire-and-forget sends (announcements, DMs)
+    bot.background_tasks = BackgroundTaskQueue()
+
+    # Dashboard broadcasts, delivered concurrently
+    bot.broadcasts = BroadcastManager(bot)
+
+    # Dashboard POST actions run as background jobs, polled through /api/jobs/{id}
+    bot.jobs = JobQueue()
+
+    # Server-Sent Events stream for dashboard viewers (/api/live)
+    bot.live_feed = LiveFeed()
+
     await load_cogs()
 
 @bot.event
@@ -141,6 +182,10 @@ async def start_health_server():
     """Complete API server with all endpoints for Monroe Dashboard"""
     print("🌐 Starting API server...")
 
+    # /api/status body, rebuilt on gateway events and a short timer
+    status_snapshot = StatusSnapshot(bot)
+    status_snapshot.start()
+
     async def check_auth(request):
         auth = request.headers.get('Authorization', '')
         if not auth.startswith('Bearer ') or auth[7:] != API_SECRET:
@@ -191,27 +236,57 @@ async def start_health_server():
         if auth_header and not (auth_header.startswith('Bearer ') and auth_header[7:] == API_SECRET):
             return web.json_response({'error': 'Unauthorized'}, status=401)
 
-        try:
-            guild_count = len(bot.guilds) if hasattr(bot, 'guilds') else 0
-            member_count = sum(g.member_count or 0 for g in bot.guilds) if hasattr(bot, 'guilds') else 0
-            uptime_seconds = (datetime.utcnow() - bot.start_time).total_seconds() if hasattr(bot, 'start_time') else 0
-            uptime_display = f"{int(uptime_seconds // 3600)}h {int((uptime_seconds % 3600) // 60)}m"
-
-            return web.json_response({
-                "online": True,
-                "serverCount": guild_count,
-                "userCount": member_count,
-                "uptime": uptime_display,
-                "lastSeen": datetime.utcnow().isoformat()
-            })
-        except Exception as e:
-            return web.json_response({
-                "online": False,
-                "serverCount": 0,
-                "userCount": 0,
-                "uptime": "Error",
-                "lastSeen": datetime.utcnow().isoformat()
-            })
+        # Served from the cached snapshot, conditional polls get a 304
+        body, etag = status_snapshot.current()
+        headers = {'ETag': etag, 'Cache-Control': f'max-age={status_snapshot.interval}'}
+        if status_snapshot.matches(request.headers.get('If-None-Match')):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type='application/json', headers=headers)
+
+    async def handle_live_token(request):
+        auth_error = await check_auth(request)
+        if auth_error: return auth_error
+
+        return web.json_response({
+            'token': bot.live_feed.issue_token(),
+            'expires_in': bot.live_feed.token_ttl
+        })
+
+    async def handle_live(request):
+        # EventSource cannot send headers, so browsers pass a feed token from
+        # /api/live/token as ?token= (never the API secret, it would end up in logs)
+        if not bot.live_feed.check_token(request.query.get('token')):
+            auth_error = await check_auth(request)
+            if auth_error: return auth_error
+
+        status_snapshot.current()
+        return await bot.live_feed.stream(request, initial=('status', status_snapshot.status))
+
+    def queue_job(request, kind, handler, label, progress=None):
+        """Submit a dashboard action as a background job and answer with its id"""
+        job, created = bot.jobs.submit(kind, handler, request.headers.get('Idempotency-Key'))
+        if job is None:
+            return web.json_response({'error': 'Job queue is full, try again later'}, status=503)
+        if created and progress is not None:
+            job.progress = progress
+
+        return web.json_response({
+            'success': True,
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': f'/api/jobs/{job.id}',
+            'duplicate': not created,
+            'message': f'{label} queued' if created else f'{label} already submitted'
+        }, status=202 if created else 200)
+
+    async def handle_job(request):
+        auth_error = await check_auth(request)
+        if auth_error: return auth_error
+
+        job = bot.jobs.get(request.match_info['job_id'])
+        if not job:
+            return web.json_response({'error': 'Job not found'}, status=404)
+        return web.json_response(job.to_dict())
 
     async def handle_broadcast(request):
         auth_error = await check_auth(request)
@@ -224,34 +299,35 @@ async def start_health_server():
             if not message:
                 return web.json_response({'error': 'Message required'}, status=400)
 
-            sent_count = 0
-            for guild in bot.guilds:
-                try:
-                    for channel_id in BROADCAST_CHANNELS:
-                        channel = bot.get_channel(channel_id)
-                        if channel and channel.guild == guild and channel.permissions_for(guild.me).send_messages:
-                            embed = discord.Embed(
-                                title="📢 Monroe Bot Broadcast",
-                                description=message,
-                                color=0x7c3aed,
-                                timestamp=datetime.utcnow()
-                            )
-                            embed.set_author(name=f"Sent by {dashboard_user}")
-                            embed.set_footer(text="Sent from Monroe Dashboard")
-                            await channel.send(content="@everyone", embed=embed)
-                            sent_count += 1
-                            print(f"✅ Broadcast sent to {channel.name}")
-                except Exception as e:
-                    print(f"❌ Broadcast error in guild {guild.name}: {e}")
-
-            return web.json_response({
-                'success': True,
-                'sent_to': sent_count,
-                'message': f'Broadcast sent to {sent_count} channels'
-            })
+            embed = discord.Embed(
+                title="📢 Monroe Bot Broadcast",
+                description=message,
+                color=0x7c3aed,
+                timestamp=datetime.utcnow()
+            )
+            embed.set_author(name=f"Sent by {dashboard_user}")
+            embed.set_footer(text="Sent from Monroe Dashboard")
+
+            # Channels are resolved now so per-channel progress is visible straight away
+            delivery = bot.broadcasts.prepare(BROADCAST_CHANNELS, content="@everyone", embed=embed)
+
+            async def run(job):
+                sent_count = await bot.broadcasts.deliver(delivery)
+                return {'sent_to': sent_count, 'message': f'Broadcast sent to {sent_count} channels'}
+
+            return queue_job(request, 'broadcast', run, 'Broadcast', progress=delivery)
         except Exception as e:
             return web.json_response({'error': str(e)}, status=500)
 
+    async def handle_broadcast_status(request):
+        auth_error = await check_auth(request)
+        if auth_error: return auth_error
+
+        job = bot.jobs.get(request.match_info['job_id'])
+        if not job or job.kind != 'broadcast':
+            return web.json_response({'error': 'Broadcast job not found'}, status=404)
+        return web.json_response(job.to_dict())
+
     async def handle_qotd(request):
         auth_error = await check_auth(request)
         if auth_error: return auth_error
@@ -263,7 +339,6 @@ async def start_health_server():
             if not question:
                 return web.json_response({'error': 'Question required'}, status=400)
 
-            sent_count = 0
             embed = discord.Embed(
                 title="🤔 Question of the Day",
                 description=question,
@@ -273,34 +348,35 @@ async def start_health_server():
             embed.set_footer(text="Answer below! 🏖️")
             embed.set_author(name=f"Sent by {dashboard_user}")
 
+            # One QOTD channel per guild, sent like a broadcast: concurrently,
+            # with the broadcast timeout and concurrency cap
+            channel_ids = []
             for guild in bot.guilds:
-                try:
+                channel = None
+                # Look for QOTD channels
+                for ch_name in ['qotd', 'question-of-the-day', 'daily-question', 'general', 'chat']:
+                    channel = discord.utils.get(guild.text_channels, name=ch_name)
+                    if channel and channel.permissions_for(guild.me).send_messages:
+                        break
                     channel = None
-                    # Look for QOTD channels
-                    for ch_name in ['qotd', 'question-of-the-day', 'daily-question', 'general', 'chat']:
-                        channel = discord.utils.get(guild.text_channels, name=ch_name)
-                        if channel and channel.permissions_for(guild.me).send_messages:
+
+                # Fallback to any channel we can send to
+                if not channel:
+                    for ch in guild.text_channels:
+                        if ch.permissions_for(guild.me).send_messages:
+                            channel = ch
                             break
 
-                    # Fallback to any channel we can send to
-                    if not channel:
-                        for ch in guild.text_channels:
-                            if ch.permissions_for(guild.me).send_messages:
-                                channel = ch
-                                break
-
-                    if channel:
-                        await channel.send(content="@everyone", embed=embed)
-                        sent_count += 1
-                        print(f"✅ QOTD sent to {channel.name}")
-                except Exception as e:
-                    print(f"❌ QOTD error in guild {guild.name}: {e}")
-
-            return web.json_response({
-                'success': True,
-                'sent_to': sent_count,
-                'message': f'QOTD sent to {sent_count} servers'
-            })
+                if channel:
+                    channel_ids.append(channel.id)
+
+            delivery = bot.broadcasts.prepare(channel_ids, content="@everyone", embed=embed)
+
+            async def run(job):
+                sent_count = await bot.broadcasts.deliver(delivery)
+                return {'sent_to': sent_count, 'message': f'QOTD sent to {sent_count} servers'}
+
+            return queue_job(request, 'qotd', run, 'QOTD', progress=delivery)
         except Exception as e:
             return web.json_response({'error': str(e)}, status=500)
 
@@ -316,7 +392,6 @@ async def start_health_server():
             if not title or not content:
                 return web.json_response({'error': 'Title and content required'}, status=400)
 
-            sent_count = 0
             embed = discord.Embed(
                 title=f"📢 {title}",
                 description=content,
@@ -326,21 +401,17 @@ async def start_health_server():
             embed.set_author(name=f"Sent by {dashboard_user}")
             embed.set_footer(text="Official Monroe Announcement")
 
-            for guild in bot.guilds:
-                try:
-                    channel = bot.get_channel(ANNOUNCEMENT_CHANNEL_ID)
-                    if channel and channel.guild == guild and channel.permissions_for(guild.me).send_messages:
-                        await channel.send(content="@everyone", embed=embed)
-                        sent_count += 1
-                        print(f"✅ Announcement sent to {channel.name}")
-                except Exception as e:
-                    print(f"❌ Announcement error in guild {guild.name}: {e}")
-
-            return web.json_response({
-                'success': True,
-                'sent_to': sent_count,
-                'message': f'Announcement sent to {sent_count} servers'
-            })
+            async def run(job):
+                sent_count = 0
+                channel = bot.get_channel(ANNOUNCEMENT_CHANNEL_ID)
+                if channel and channel.permissions_for(channel.guild.me).send_messages:
+                    await channel.send(content="@everyone", embed=embed)
+                    sent_count += 1
+                    print(f"✅ Announcement sent to {channel.name}")
+
+                return {'sent_to': sent_count, 'message': f'Announcement sent to {sent_count} servers'}
+
+            return queue_job(request, 'announcement', run, 'Announcement')
         except Exception as e:
             return web.json_response({'error': str(e)}, status=500)
 
@@ -361,105 +432,120 @@ async def start_health_server():
             if action not in ['warn', 'kick', 'ban']:
                 return web.json_response({'error': 'Invalid action'}, status=400)
 
-            # Use first available guild
-            guild = bot.guilds[0] if bot.guilds else None
-            if not guild:
-                return web.json_response({'error': 'No guild available'}, status=404)
-
-            # Get member
-            try:
-                member = await guild.fetch_member(int(user_id))
-            except:
-                return web.json_response({'error': 'User not found'}, status=404)
-
-            result = ""
-
-            if action == 'warn':
-                try:
-                    # Send DM to user
-                    dm_embed = discord.Embed(
-                        title="⚠️ Warning - Monroe Social Club",
-                        description=f"You have been warned in {guild.name}",
-                        color=0xfbbf24,
-                        timestamp=datetime.utcnow()
-                    )
-                    dm_embed.add_field(name="Reason", value=reason, inline=False)
-                    dm_embed.add_field(name="Staff Member", value=dashboard_user, inline=True)
-                    dm_embed.set_footer(text="Please follow server rules to avoid further action.")
-
-                    await member.send(embed=dm_embed)
-                    dm_result = "DM sent"
-                except:
-                    dm_result = "DM failed"
-
-                # Log to moderation channel
-                try:
-                    from bot.config import Config
-                    from bot.embeds import create_moderation_embed
-
-                    # Create a mock staff member object for the embed
-                    class MockUser:
-                        def __init__(self, name):
-                            self.mention = f"@{name}"
-                            self.name = name
-                            self.discriminator = "0000"
-                            self.id = "dashboard"
-                            self.avatar = None
-                            self.default_avatar = type('obj', (object,), {'url': 'https://cdn.discordapp.com/embed/avatars/0.png'})()
-
-                    mock_staff = MockUser(dashboard_user)
-
-                    # Create moderation embed
-                    log_embed = create_moderation_embed(
-                        action="Warning",
-                        target=member,
-                        staff_member=mock_staff,
-                        reason=reason,
-                        color=Config.COLORS["warning"]
-                    )
-
-                    # Send to both moderation log channels
-                    log_channels = [
-                        bot.get_channel(1353388676981456917),
-                        bot.get_channel(1387524238117830776)
-                    ]
-
-                    logged_count = 0
-                    for log_channel in log_channels:
-                        if log_channel:
-                            try:
-                                await log_channel.send(embed=log_embed)
-                                logged_count += 1
-                            except Exception as e:
-                                print(f"Failed to send dashboard log to channel {log_channel.id}: {e}")
-
-                    log_result = f"logged to {logged_count} channels" if logged_count > 0 else "log failed"
-
-                    result = f"Warning issued to {member.display_name} ({dm_result}, {log_result})"
-                except Exception as e:
-                    result = f"Warning issued to {member.display_name} ({dm_result}, log failed: {str(e)})"
-
-            elif action == 'kick':
-                await member.kick(reason=f"Dashboard moderation by {dashboard_user}: {reason}")
-                result = f"Successfully kicked {member.display_name}"
-
-            elif action == 'ban':
-                await member.ban(reason=f"Dashboard moderation by {dashboard_user}: {reason}")
-                result = f"Successfully banned {member.display_name}"
-
-            print(f"✅ Moderation: {action} on {member.display_name} by {dashboard_user}")
-
-            return web.json_response({
-                'success': True,
-                'message': result,
-                'action': action,
-                'user': member.display_name
-            })
+            if not str(user_id).isdigit():
+                return web.json_response({'error': 'Invalid user_id'}, status=400)
 
+            return queue_job(
+                request,
+                'moderation',
+                functools.partial(run_moderation, action, int(user_id), reason, dashboard_user),
+                f'{action.capitalize()} for {user_id}'
+            )
         except Exception as e:
             print(f"❌ Moderation error: {str(e)}")
             return web.json_response({'error': str(e)}, status=500)
 
+    async def run_moderation(action, user_id, reason, dashboard_user, job):
+        """Carry out a dashboard moderation action (runs as a job)"""
+        # Use first available guild
+        guild = bot.guilds[0] if bot.guilds else None
+        if not guild:
+            raise LookupError('No guild available')
+
+        # Get member
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.HTTPException:
+            raise LookupError('User not found')
+
+        result = ""
+        deliveries = []
+
+        if action == 'warn':
+            # DM for the user, sent together with the log embeds below
+            dm_embed = discord.Embed(
+                title="⚠️ Warning - Monroe Social Club",
+                description=f"You have been warned in {guild.name}",
+                color=0xfbbf24,
+                timestamp=datetime.utcnow()
+            )
+            dm_embed.add_field(name="Reason", value=reason, inline=False)
+            dm_embed.add_field(name="Staff Member", value=dashboard_user, inline=True)
+            dm_embed.set_footer(text="Please follow server rules to avoid further action.")
+
+            targets = [(f"dm:{member.id}", functools.partial(member.send, embed=dm_embed))]
+
+            # Log to moderation channel
+            try:
+                from bot.config import Config
+                from bot.embeds import create_moderation_embed
+
+                # Create a mock staff member object for the embed
+                class MockUser:
+                    def __init__(self, name):
+                        self.mention = f"@{name}"
+                        self.name = name
+                        self.discriminator = "0000"
+                        self.id = "dashboard"
+                        self.avatar = None
+                        self.default_avatar = type('obj', (object,), {'url': 'https://cdn.discordapp.com/embed/avatars/0.png'})()
+
+                mock_staff = MockUser(dashboard_user)
+
+                # Create moderation embed
+                log_embed = create_moderation_embed(
+                    action="Warning",
+                    target=member,
+                    staff_member=mock_staff,
+                    reason=reason,
+                    color=Config.COLORS["warning"]
+                )
+
+                # Send to both moderation log channels
+                for channel_id in Config.MODERATION_LOG_CHANNELS:
+                    log_channel = bot.get_channel(channel_id)
+                    if log_channel:
+                        targets.append((f"channel:{channel_id}", functools.partial(log_channel.send, embed=log_embed)))
+                    else:
+                        deliveries.append({'target': f"channel:{channel_id}", 'success': False, 'error': 'channel not found'})
+
+                log_error = None
+            except Exception as e:
+                log_error = str(e)
+
+            # DM and log channels are delivered concurrently
+            deliveries = await fan_out(targets) + deliveries
+            for delivery in deliveries:
+                if not delivery['success']:
+                    print(f"Failed dashboard delivery to {delivery['target']}: {delivery['error']}")
+
+            dm_result = "DM sent" if deliveries[0]['success'] else "DM failed"
+            logged_count = count_delivered(deliveries[1:])
+            if log_error:
+                log_result = f"log failed: {log_error}"
+            else:
+                log_result = f"logged to {logged_count} channels" if logged_count > 0 else "log failed"
+
+            result = f"Warning issued to {member.display_name} ({dm_result}, {log_result})"
+
+        elif action == 'kick':
+            await member.kick(reason=f"Dashboard moderation by {dashboard_user}: {reason}")
+            result = f"Successfully kicked {member.display_name}"
+
+        elif action == 'ban':
+            await member.ban(reason=f"Dashboard moderation by {dashboard_user}: {reason}")
+            result = f"Successfully banned {member.display_name}"
+
+        bot.dispatch('moderation_action', {'warn': 'Warning', 'kick': 'Kick', 'ban': 'Ban'}[action], member, dashboard_user, reason)
+        print(f"✅ Moderation: {action} on {member.display_name} by {dashboard_user}")
+
+        return {
+            'message': result,
+            'action': action,
+            'user': member.display_name,
+            'deliveries': deliveries
+        }
+
     # Create web app with all endpoints
     app = web.Application()
 
@@ -471,6 +557,10 @@ async def start_health_server():
     app.router.add_get('/api/status', handle_status)
     app.router.add_post('/api/login', handle_login)
     app.router.add_post('/api/broadcast', handle_broadcast)
+    app.router.add_get('/api/broadcast/{job_id}', handle_broadcast_status)
+    app.router.add_get('/api/jobs/{job_id}', handle_job)
+    app.router.add_get('/api/live', handle_live)
+    app.router.add_post('/api/live/token', handle_live_token)
     app.router.add_post('/api/qotd', handle_qotd)
     app.router.add_post('/api/announcement', handle_announcement)
     app.router.add_post('/api/moderation', handle_moderation)
@@ -589,15 +679,30 @@ async def main():
     """Main function to start both bot and server"""
     print("🌴 Monroe Social Club Bot - Starting...")
 
+    # Setup bot with cogs loaded, the API handlers use the queues and live feed it creates
+    await setup_bot()
+
     # Start the health server
     await start_health_server()
 
-    # Setup bot with cogs loaded
-    await setup_bot()
+    # Render stops the service with SIGTERM, close the bot so the shutdown flush runs
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(bot.close()))
+    except NotImplementedError:
+        pass  # No signal handlers on Windows event loops
 
     # Start the bot
     print("🔌 Connecting to Discord...")
-    await bot.start(os.getenv('DISCORD_TOKEN'))
+    try:
+        await bot.start(os.getenv('DISCORD_TOKEN'))
+    finally:
+        # Persist activity counters that have not been flushed yet
+        activity_cog = bot.get_cog('ActivityLeaderboardCog')
+        if activity_cog:
+            await activity_cog.close_store()
+
+        # Queued sends were flushed in bot.close(), before Discord's HTTP session closed
+        await bot.http_session.close()
 
 # Run the bot
 if __name__ == "__main__":